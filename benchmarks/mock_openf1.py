@@ -0,0 +1,242 @@
+"""
+Local mock of the OpenF1 API for benchmarks.
+
+Serves deterministic synthetic fixtures sized like real seasons (2024-2026,
+24 meetings of five sessions each; 2023 is left empty; a race has ~1,100 laps, ~1,500 position
+updates and 120 weather samples), or, with a bundle directory, real data
+recorded by ``python -m f1dash.bundle export``. Supports the comparison
+filters, ``csv=true`` and gzip like the real API, and counts every request
+and the bytes sent in STATS.
+
+Run standalone with ``python benchmarks/mock_openf1.py [port] [--bundle DIR]``.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import random
+import re
+import sys
+import threading
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TEAMS = [("Red Bull Racing", "3671C6"), ("Ferrari", "E8002D"), ("Mercedes", "27F4D2"), ("McLaren", "FF8000"),
+         ("Aston Martin", "229971"), ("Alpine", "FF87BC"), ("Williams", "64C4FF"), ("RB", "6692FF"),
+         ("Kick Sauber", "52E252"), ("Haas F1 Team", "B6BABD")]
+DRIVERS = [(1, "Max VERSTAPPEN"), (11, "Sergio PEREZ"), (16, "Charles LECLERC"), (55, "Carlos SAINZ"),
+           (44, "Lewis HAMILTON"), (63, "George RUSSELL"), (4, "Lando NORRIS"), (81, "Oscar PIASTRI"),
+           (14, "Fernando ALONSO"), (18, "Lance STROLL"), (10, "Pierre GASLY"), (31, "Esteban OCON"),
+           (23, "Alexander ALBON"), (2, "Logan SARGEANT"), (22, "Yuki TSUNODA"), (3, "Daniel RICCIARDO"),
+           (77, "Valtteri BOTTAS"), (24, "ZHOU Guanyu"), (20, "Kevin MAGNUSSEN"), (27, "Nico HULKENBERG")]
+SESSION_NAMES = [("Practice 1", "Practice"), ("Practice 2", "Practice"), ("Practice 3", "Practice"),
+                 ("Qualifying", "Qualifying"), ("Race", "Race")]
+POINTS = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
+YEARS = range(2024, 2027)  # the dashboard also offers 2023: a season without data
+N_MEETINGS = 24
+POSITION_SAMPLES = 1500  # 20 s apart, ~5% of drivers change place per sample
+SESSION_ENDPOINTS = {"drivers", "session_result", "laps", "stints", "pit", "position", "weather"}
+
+STATS = {"calls": 0, "bytes": 0, "log": []}
+_stats_lock = threading.Lock()
+
+
+def reset_stats():
+    with _stats_lock:
+        STATS.update(calls=0, bytes=0, log=[])
+
+
+# ── synthetic fixtures ────────────────────────────────────────────────────────
+def _iso(d: datetime) -> str:
+    return d.isoformat()
+
+
+def _calendar():
+    meetings, sessions = [], []
+    for year in YEARS:
+        start = datetime(year, 3, 1, 12, tzinfo=timezone.utc)
+        for i in range(N_MEETINGS):
+            mk = year * 100 + i
+            d0 = start + timedelta(days=11 * i)
+            meetings.append({"meeting_key": mk, "meeting_name": f"Grand Prix {i + 1:02d}", "year": year,
+                             "date_start": _iso(d0), "country_name": f"Country {i}",
+                             "circuit_short_name": f"Circuit {i}"})
+            for j, (name, kind) in enumerate(SESSION_NAMES):
+                ds = d0 + timedelta(hours=20 * j)
+                sessions.append({"session_key": (year - 2000) * 1000 + i * 5 + j, "session_name": name,
+                                 "session_type": kind, "meeting_key": mk, "year": year,
+                                 "date_start": _iso(ds), "date_end": _iso(ds + timedelta(hours=2))})
+    return meetings, sessions
+
+
+MEETINGS, SESSIONS = _calendar()
+
+
+def session_rows(endpoint: str, s: dict) -> list:
+    """All rows of one endpoint for one session; the same on every call."""
+    rng = random.Random(f"{endpoint}-{s['session_key']}")
+    base = {"session_key": s["session_key"], "meeting_key": s["meeting_key"]}
+    t0 = datetime.fromisoformat(s["date_start"])
+    race = s["session_name"] == "Race"
+    order = list(DRIVERS)
+    random.Random(s["session_key"]).shuffle(order)
+    nlaps = 57 if race else 25
+
+    if endpoint == "drivers":
+        return [dict(base, driver_number=n, full_name=name, broadcast_name=name,
+                     name_acronym=name.split()[-1][:3].upper(), team_name=TEAMS[i // 2][0],
+                     team_colour=TEAMS[i // 2][1], country_code="NED")
+                for i, (n, name) in enumerate(DRIVERS)]
+    if endpoint == "session_result":
+        return [dict(base, driver_number=n, position=p, points=POINTS.get(p, 0) if race else None,
+                     gap_to_leader=0 if p == 1 else ("+1 LAP" if p > 18 else round(p * 1.7, 3)),
+                     dnf=False, dns=False, dsq=False, number_of_laps=nlaps - (p > 18))
+                for p, (n, _) in enumerate(order, 1)]
+    if endpoint == "laps":
+        rows = []
+        for n, _ in DRIVERS:
+            t = t0
+            for lap in range(1, nlaps + 1):
+                dur = round(90 + rng.random() * 3 + (30 if lap == 1 else 0) + lap * 0.02, 3)
+                rows.append(dict(base, driver_number=n, lap_number=lap, date_start=_iso(t), lap_duration=dur,
+                                 duration_sector_1=round(dur * 0.3, 3), duration_sector_2=round(dur * 0.4, 3),
+                                 duration_sector_3=round(dur * 0.3, 3), i1_speed=rng.randint(250, 320),
+                                 i2_speed=rng.randint(250, 320), st_speed=rng.randint(280, 340),
+                                 is_pit_out_lap=lap in (1, 21, 41),
+                                 segments_sector_1=[rng.choice((2048, 2049, 2051)) for _ in range(8)]))
+                t += timedelta(seconds=dur)
+        return rows
+    if endpoint == "stints":
+        cuts = [1, 20, 40, nlaps]
+        return [dict(base, driver_number=n, stint_number=k + 1, lap_start=cuts[k] + (k > 0), lap_end=cuts[k + 1],
+                     compound=("SOFT", "MEDIUM", "HARD")[(k + n) % 3], tyre_age_at_start=0)
+                for n, _ in DRIVERS for k in range(3)]
+    if endpoint == "pit":
+        return [dict(base, driver_number=n, lap_number=lap, pit_duration=round(20 + rng.random() * 5, 2),
+                     date=_iso(t0 + timedelta(seconds=lap * 91)))
+                for n, _ in DRIVERS for lap in (20, 40)]
+    if endpoint == "position":
+        return [dict(base, driver_number=n, position=rng.randint(1, 20), date=_iso(t0 + timedelta(seconds=k * 20)))
+                for k in range(POSITION_SAMPLES) for n, _ in DRIVERS
+                if k == 0 or rng.random() < 0.05]
+    if endpoint == "weather":
+        return [dict(base, date=_iso(t0 + timedelta(minutes=m)), air_temperature=round(25 + rng.random(), 1),
+                     track_temperature=round(40 + rng.random() * 3, 1), humidity=50.0, pressure=1012.0,
+                     rainfall=0, wind_speed=round(rng.random() * 4, 1), wind_direction=rng.randint(0, 359))
+                for m in range(120)]
+    return []
+
+
+# ── filtering ─────────────────────────────────────────────────────────────────
+def parse_query(qs: str) -> list:
+    filters = []
+    for part in qs.split("&"):
+        m = re.match(r"^([a-z_0-9]+)(>=|<=|>|<|=)(.*)$", urllib.parse.unquote_plus(part))
+        if m:
+            filters.append(m.groups())
+    return filters
+
+
+def _coerce(value: str, ref):
+    if isinstance(ref, bool):
+        return value.lower() == "true"
+    if isinstance(ref, int):
+        return int(value)
+    if isinstance(ref, float):
+        return float(value)
+    return value
+
+
+def _match(row: dict, filters: list) -> bool:
+    for key, op, value in filters:
+        if row.get(key) is None:
+            return False
+        a, b = row[key], _coerce(value, row[key])
+        if not {"=": a == b, ">": a > b, "<": a < b, ">=": a >= b, "<=": a <= b}[op]:
+            return False
+    return True
+
+
+def synthetic(endpoint: str, filters: list) -> list:
+    if endpoint == "meetings":
+        rows = MEETINGS
+    elif endpoint == "sessions":
+        rows = SESSIONS
+    elif endpoint in SESSION_ENDPOINTS:
+        scope = [f for f in filters if f[0] in ("session_key", "meeting_key")]
+        rows = [r for s in SESSIONS if _match(s, scope) for r in session_rows(endpoint, s)]
+    else:
+        rows = []
+    return [r for r in rows if _match(r, filters)]
+
+
+# ── server ────────────────────────────────────────────────────────────────────
+def make_handler(store=None):
+    """Request handler serving synthetic data, or a BundleStore when given."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            path, _, qs = self.path.partition("?")
+            endpoint = path.rstrip("/").rsplit("/", 1)[-1]
+            filters = parse_query(qs)
+            as_csv = any(k == "csv" for k, _, _ in filters)
+            filters = [f for f in filters if f[0] != "csv"]
+            if store is not None:
+                rows = store.query(endpoint, {k + ("" if op == "=" else op): v for k, op, v in filters})
+            else:
+                rows = synthetic(endpoint, filters)
+
+            if as_csv:
+                buf = io.StringIO()
+                if rows:
+                    writer = csv.DictWriter(buf, fieldnames=list(dict.fromkeys(k for r in rows for k in r)))
+                    writer.writeheader()
+                    writer.writerows(rows)
+                body, ctype = buf.getvalue().encode(), "text/csv"
+            else:
+                body, ctype = json.dumps(rows).encode(), "application/json"
+            gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+            if gzipped:
+                body = gzip.compress(body, compresslevel=5)
+
+            with _stats_lock:
+                STATS["calls"] += 1
+                STATS["bytes"] += len(body)
+                STATS["log"].append(self.path)
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def serve(port: int = 0, bundle: str = None) -> ThreadingHTTPServer:
+    """Start the mock on a daemon thread; the bound port is server.server_address[1]."""
+    store = None
+    if bundle:
+        from f1dash.bundle import BundleStore
+
+        store = BundleStore(bundle)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(store))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    args = sys.argv[1:]
+    bundle = args[args.index("--bundle") + 1] if "--bundle" in args else None
+    port = int(args[0]) if args and args[0].isdigit() else 8765
+    serve(port, bundle)
+    print(f"mock OpenF1 on http://127.0.0.1:{port}/v1")
+    threading.Event().wait()
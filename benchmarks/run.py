@@ -0,0 +1,240 @@
+"""
+End-to-end benchmarks for the dashboard.
+
+Runs openf1_dashboard.py headlessly with Streamlit's AppTest against the
+local mock in mock_openf1.py and records, for every step of every scenario:
+
+    latency_s        wall time of the script rerun (median over --repeat)
+    upstream_calls   requests that reached the mock API
+    upstream_bytes   bytes the mock sent (gzip, as on the wire)
+    peak_memory_mb   tracemalloc peak during the rerun
+    figure_bytes     size of the Plotly figure JSON sent to the browser
+
+Memory is measured in a separate pass, because tracemalloc slows Python
+down enough to distort latency. Every scenario starts from empty caches.
+
+    python benchmarks/run.py --out results.json
+    python benchmarks/run.py --baseline results.json   # exit 1 on regressions
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SCRIPT = os.path.join(ROOT, "openf1_dashboard.py")
+TIMEOUT = 300
+
+# Metrics compared against a baseline, and how much worse each may get.
+TOLERANCES = {"latency_s": 0.25, "upstream_calls": 0.0, "upstream_bytes": 0.10,
+              "peak_memory_mb": 0.25, "figure_bytes": 0.10}
+
+
+def _tab(label: str):
+    return lambda at: at.radio(key="active_tab").set_value(label)
+
+
+def _sidebar(label: str, pick):
+    def action(at):
+        box = next(b for b in at.sidebar.selectbox if b.label == label)
+        box.set_value(pick(box.options))
+    return action
+
+
+# Each scenario is a list of (step, action) run in order from a cold start;
+# the first step (action None) is the initial page load.
+TABS = ["🏆 Championship", "📊 Race Results", "⏱ Lap Times", "🛞 Stints", "🔧 Pit Stops", "🏁 Positions", "🌦 Weather"]
+SCENARIOS = {
+    "cold_season": [
+        ("initial_load", None),
+    ],
+    "season_switch": [
+        ("initial_load", None),
+        ("previous_season", _sidebar("Season", lambda opts: opts[1])),
+        ("back_to_current", _sidebar("Season", lambda opts: opts[0])),
+    ],
+    "tabs": [("initial_load", None)] + [(f"tab:{label.split(' ', 1)[1]}", _tab(label)) for label in TABS[1:]],
+    "driver_filter": [
+        ("initial_load", None),
+        ("lap_times", _tab("⏱ Lap Times")),
+        ("select_driver", _sidebar("Driver", lambda opts: opts[1])),
+        ("other_driver", _sidebar("Driver", lambda opts: opts[2])),
+        ("positions_filtered", _tab("🏁 Positions")),
+        ("clear_driver", _sidebar("Driver", lambda opts: opts[0])),
+    ],
+    "session_switch": [
+        ("initial_load", None),
+        ("lap_times", _tab("⏱ Lap Times")),
+        ("qualifying", _sidebar("Session", lambda opts: next(o for o in opts if "Qualifying" in o))),
+        ("previous_meeting", _sidebar("Race / Grand Prix", lambda opts: opts[-2])),
+    ],
+    "all_meetings": [
+        ("initial_load", None),
+        ("all_meetings", _sidebar("Race / Grand Prix", lambda opts: opts[0])),
+        ("results_all", _tab("📊 Race Results")),
+    ],
+    "empty_season": [
+        ("initial_load", None),
+        ("empty_season", _sidebar("Season", lambda opts: opts[-1])),
+        ("results_empty", _tab("📊 Race Results")),
+    ],
+}
+
+
+def _figure_bytes(at) -> int:
+    return sum(len(el.proto.spec) for el in at.get("plotly_chart"))
+
+
+def _reset(cache_dir: str):
+    """Empty every cache so the scenario starts cold."""
+    import streamlit as st
+
+    from f1dash.memory import memory_cache
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    memory_cache.clear()
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def run_scenario(steps: list, mock, cache_dir: str, memory: bool) -> list:
+    from streamlit.testing.v1 import AppTest
+
+    _reset(cache_dir)
+    at = AppTest.from_file(SCRIPT, default_timeout=TIMEOUT)
+    results = []
+    for name, action in steps:
+        if action is not None:
+            action(at)
+        mock.reset_stats()
+        if memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        at.run()
+        latency = time.perf_counter() - started
+        step = {"step": name, "latency_s": round(latency, 4)}
+        if memory:
+            step["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+            tracemalloc.stop()
+        step.update(
+            upstream_calls=mock.STATS["calls"],
+            upstream_bytes=mock.STATS["bytes"],
+            figure_bytes=_figure_bytes(at),
+            errors=[e.message for e in at.exception] + [e.value for e in at.error],
+        )
+        results.append(step)
+    return results
+
+
+def run(scenarios: list, repeat: int, mock, cache_dir: str) -> dict:
+    out = {}
+    for name in scenarios:
+        timing = [run_scenario(SCENARIOS[name], mock, cache_dir, memory=False) for _ in range(repeat)]
+        memory = run_scenario(SCENARIOS[name], mock, cache_dir, memory=True)
+        steps = []
+        for i, step in enumerate(timing[0]):
+            step = dict(step, latency_s=round(statistics.median(r[i]["latency_s"] for r in timing), 4))
+            step["peak_memory_mb"] = memory[i]["peak_memory_mb"]
+            steps.append(step)
+        out[name] = steps
+        print(f"{name:15s} " + "  ".join(f"{s['step']}={s['latency_s']:.3f}s/{s['upstream_calls']}c" for s in steps),
+              file=sys.stderr)
+    return out
+
+
+def compare(results: dict, baseline: dict) -> list:
+    """Return a description of every metric that got worse than its tolerance."""
+    regressions = []
+    for name, steps in results["scenarios"].items():
+        before = {s["step"]: s for s in baseline.get("scenarios", {}).get(name, [])}
+        for step in steps:
+            old = before.get(step["step"])
+            if old is None:
+                continue
+            for metric, tolerance in TOLERANCES.items():
+                if metric in old and step[metric] > old[metric] * (1 + tolerance) + (metric == "latency_s") * 0.01:
+                    regressions.append(f"{name}/{step['step']} {metric}: {old[metric]} -> {step[metric]}")
+    return regressions
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the dashboard benchmarks against a mock OpenF1 API.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="default: all")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per scenario (median is reported)")
+    parser.add_argument("--bundle", help="serve recorded data from an f1dash bundle instead of synthetic data")
+    parser.add_argument("--out", help="write JSON results here (default: stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare against; exit 1 on regressions")
+    args = parser.parse_args(argv)
+
+    cache_dir = tempfile.mkdtemp(prefix="openf1-bench-")
+    sys.path[:0] = [HERE, ROOT]
+    import mock_openf1 as mock
+
+    server = mock.serve(bundle=args.bundle)
+    # Configure the app before f1dash is imported: no warm-up thread or rate
+    # limiter in the way of what is being measured.
+    os.environ.update(
+        OPENF1_BASE_URL=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        OPENF1_CACHE_DIR=cache_dir,
+        OPENF1_WARMUP="0",
+        OPENF1_RATE_LIMIT="1000000",
+        OPENF1_RATE_BURST="1000000",
+    )
+    os.environ.pop("OPENF1_BUNDLE", None)
+    os.environ.pop("OPENF1_REDIS_URL", None)
+
+    try:
+        import pandas
+        import streamlit
+
+        results = {
+            "meta": {
+                "revision": _git_revision(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "streamlit": streamlit.__version__,
+                "pandas": pandas.__version__,
+                "fixtures": args.bundle or "synthetic",
+                "repeat": args.repeat,
+            },
+            "scenarios": run(args.scenario or list(SCENARIOS), args.repeat, mock, cache_dir),
+        }
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        for line in regressions:
+            print("REGRESSION", line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Startup benchmark for the dashboard.
+
+Measures what a new server process pays before and after its first page:
+every sample is a fresh Python process that runs openf1_dashboard.py with
+Streamlit's AppTest against the mock in mock_openf1.py, and records
+
+    first_run_s      the first script run: importing the app, then the
+                     default view (Streamlit itself is imported beforehand)
+    app_modules      modules that first run imported
+    rerun_s          an unchanged rerun of the default view (median of RERUNS)
+    tab:<view>       the first switch to each other view
+
+The on-disk response cache is filled by an untimed run first, so the numbers
+are import and compute time rather than the mock's. Medians over --repeat
+processes are reported.
+
+    python benchmarks/startup.py --out startup.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SCRIPT = os.path.join(ROOT, "openf1_dashboard.py")
+TIMEOUT = 300
+RERUNS = 5
+TABS = ["📊 Race Results", "⏱ Lap Times", "🛞 Stints", "🔧 Pit Stops", "🏁 Positions", "🌦 Weather"]
+
+
+def child() -> dict:
+    """One cold process: time the first run, reruns and the first visit of each view."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(SCRIPT, default_timeout=TIMEOUT)
+    before = set(sys.modules)
+    started = time.perf_counter()
+    at.run()
+    sample = {"first_run_s": time.perf_counter() - started, "app_modules": len(set(sys.modules) - before)}
+
+    reruns = []
+    for _ in range(RERUNS):
+        started = time.perf_counter()
+        at.run()
+        reruns.append(time.perf_counter() - started)
+    sample["rerun_s"] = statistics.median(reruns)
+
+    for label in TABS:
+        at.radio(key="active_tab").set_value(label)
+        started = time.perf_counter()
+        at.run()
+        sample[f"tab:{label.split(' ', 1)[1]}"] = time.perf_counter() - started
+    sample["errors"] = [e.message for e in at.exception] + [e.value for e in at.error]
+    return sample
+
+
+def _spawn(env: dict) -> dict:
+    out = subprocess.run([sys.executable, __file__, "--child"], env=env, cwd=ROOT,
+                         capture_output=True, text=True, timeout=TIMEOUT, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the dashboard's cold start and rerun times.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes to sample (median is reported)")
+    parser.add_argument("--out", help="write JSON results here (default: stdout)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        sys.path[:0] = [ROOT]
+        print(json.dumps(child()))
+        return 0
+
+    cache_dir = tempfile.mkdtemp(prefix="openf1-startup-")
+    sys.path[:0] = [HERE, ROOT]
+    import mock_openf1 as mock
+
+    server = mock.serve()
+    env = dict(
+        os.environ,
+        OPENF1_BASE_URL=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        OPENF1_CACHE_DIR=cache_dir,
+        OPENF1_WARMUP="0",
+        OPENF1_RATE_LIMIT="1000000",
+        OPENF1_RATE_BURST="1000000",
+    )
+    for name in ("OPENF1_BUNDLE", "OPENF1_REDIS_URL", "OPENF1_ARTIFACTS"):
+        env.pop(name, None)
+
+    try:
+        _spawn(env)  # fills the disk cache
+        samples = [_spawn(env) for _ in range(args.repeat)]
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    results = {k: round(statistics.median(s[k] for s in samples), 4)
+               for k in samples[0] if k != "errors"}
+    results["errors"] = sorted({e for s in samples for e in s["errors"]})
+    print("  ".join(f"{k}={v}" for k, v in results.items() if k != "errors"), file=sys.stderr)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
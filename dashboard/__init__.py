@@ -0,0 +1 @@
+"""The Streamlit side of the OpenF1 dashboard: the data layer and one module per view."""
@@ -0,0 +1,236 @@
+"""
+What every view of the dashboard shares: fetching (through the memory, shared
+and bundle caches), whole-session frames, the sidebar's Selection, the figure
+cache and the chart theme.
+
+Imported once per process, so the Streamlit resources and memoized helpers
+below are defined once rather than on every script rerun. Nothing here
+imports Plotly Express or pyarrow's Parquet and CSV readers: views that draw
+charts import Plotly themselves, and the readers load with the first bundle
+or CSV read.
+"""
+
+import os
+from typing import NamedTuple
+
+import pandas as pd
+import streamlit as st
+
+from f1dash import metrics
+from f1dash.bundle import BUNDLE_DIR, BundleStore
+from f1dash.cache import ResponseCache
+from f1dash.client import get_csv, get_json
+from f1dash.drivers import DriverIndex
+from f1dash.figures import FigureCache, fingerprint
+from f1dash.ingest import CSV_ENDPOINTS, csv_requests, read_csv
+from f1dash.laps import LapAnalytics, analyze_laps
+from f1dash.live import LIVE_ENDPOINTS, FeedRegistry
+from f1dash.memory import memory_cache
+from f1dash.schema import normalize
+from f1dash.warmup import WARMUP_ENABLED, Warmer
+
+STYLE_PATH = os.path.join(os.path.dirname(__file__), "style.css")
+WARMING = WARMUP_ENABLED and not BUNDLE_DIR  # nothing to warm when replaying a bundle
+
+
+class Selection(NamedTuple):
+    """The sidebar's choices, as every view reads them."""
+    year: int
+    meetings: pd.DataFrame    # the season's meetings
+    meeting_key: int          # None for "All"
+    session_key: int          # None for "All"
+    drivers: DriverIndex      # the season's driver index
+    drivers_df: pd.DataFrame  # drivers of the selected session or meeting
+    driver_number: int        # Driver filter, None for "All"
+    team: str                 # Team filter, None for "All"
+    live: bool = False        # the selected session is running and live updates are on
+
+
+@st.cache_resource(show_spinner=False)
+def style() -> str:
+    """The dashboard's CSS, read from style.css once per process."""
+    with open(STYLE_PATH, encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+# ─── API helpers ──────────────────────────────────────────────────────────────
+@st.cache_resource(show_spinner=False)
+def response_cache() -> ResponseCache:
+    return ResponseCache()
+
+@st.cache_resource(show_spinner=False)
+def bundle() -> BundleStore:
+    return BundleStore(BUNDLE_DIR)
+
+@st.cache_resource(show_spinner=False)
+def artifacts():
+    """Championship state and precomputed race laps: OPENF1_ARTIFACTS if set,
+    else under the cache directory."""
+    from f1dash.artifacts import ArtifactStore  # pyarrow.parquet, only once it is used
+    return ArtifactStore()
+
+def upstream(endpoint: str, params: dict = None) -> list:
+    """OpenF1 itself, or the offline bundle when OPENF1_BUNDLE is set."""
+    return bundle().query(endpoint, params) if BUNDLE_DIR else get_json(endpoint, params)
+
+def _shared(endpoint: str, params: dict = None) -> list:
+    # The shared cache is single-flight across threads and replicas; a local
+    # bundle is read directly. Neither keeps a copy in memory_cache.
+    if BUNDLE_DIR:
+        metrics.note_source("bundle")
+        return bundle().query(endpoint, params)
+    metrics.note_source("shared")
+    return response_cache().get_or_fetch(endpoint, params, get_json)
+
+@memory_cache.memoize
+def _fetch_cached(endpoint: str, params: dict = None) -> list:
+    # Raises on failure: memory_cache does not memoize exceptions, so a
+    # transient error is retried on the next rerun instead of sticking around.
+    return _shared(endpoint, params)
+
+@st.cache_resource(show_spinner=False)
+def warmer() -> Warmer:
+    """Process-wide warm-up worker, started by the first script run."""
+    w = Warmer(response_cache())
+    w.start()
+    return w
+
+def fetch(endpoint: str, params: dict = None) -> list:
+    try:
+        with metrics.fetching(endpoint):
+            return _fetch_cached(endpoint, params)
+    except Exception as e:
+        st.error(f"API error ({endpoint}): {e}")
+        return []
+
+def df(data: list) -> pd.DataFrame:
+    return pd.DataFrame(data) if data else pd.DataFrame()
+
+def season_span(sessions: pd.DataFrame) -> dict:
+    """session_key range params covering every session in the frame."""
+    return {"session_key>=": int(sessions["session_key"].min()), "session_key<=": int(sessions["session_key"].max())}
+
+@memory_cache.memoize
+def _driver_index_cached(year: int) -> DriverIndex:
+    # All of a season's drivers in one range request, instead of one per session.
+    sessions = df(_fetch_cached("sessions", {"year": year}))
+    if sessions.empty or "session_key" not in sessions.columns:
+        return DriverIndex(pd.DataFrame())
+    return DriverIndex(df(_fetch_cached("drivers", season_span(sessions))))
+
+def driver_index(year: int) -> DriverIndex:
+    """Season-wide driver/team lookup, keyed by (session_key, driver_number)."""
+    try:
+        with metrics.fetching("drivers"):
+            return _driver_index_cached(year)
+    except Exception as e:
+        st.error(f"API error (drivers): {e}")
+        return DriverIndex(pd.DataFrame())
+
+def _with_drivers(data: pd.DataFrame, session_key: int, year: int) -> pd.DataFrame:
+    if data.empty or "driver_number" not in data.columns:
+        return data
+    data = _driver_index_cached(year).attach(data, session_key)
+    return data.sort_values("driver_number", kind="stable", ignore_index=True)
+
+def _columnar(endpoint: str, session_key: int, year: int) -> pd.DataFrame:
+    """A large endpoint parsed straight into columns: Parquet from the bundle,
+    or OpenF1's CSV in date windows, each window cached like any response."""
+    if BUNDLE_DIR:
+        metrics.note_source("bundle")
+        return normalize(bundle().frame(endpoint, {"session_key": session_key}), endpoint)
+    sessions = df(_fetch_cached("sessions", {"year": year}))
+    rows = sessions[sessions["session_key"] == session_key] if "session_key" in sessions.columns else sessions
+    session = rows.iloc[0] if not rows.empty else {}
+    metrics.note_source("shared")
+    return read_csv(
+        [response_cache().get_or_fetch(endpoint, params, get_csv)
+         for params in csv_requests(endpoint, session_key, session.get("date_start"), session.get("date_end"))],
+        endpoint,
+    )
+
+@memory_cache.memoize
+def _session_data_cached(endpoint: str, session_key: int, year: int) -> pd.DataFrame:
+    if endpoint == "laps":
+        # A race's laps, with stints and drivers attached, from the precompute job.
+        precomputed = artifacts().session_laps(year, session_key)
+        if precomputed is not None:
+            metrics.note_source("artifacts")
+            return precomputed.sort_values("driver_number", kind="stable", ignore_index=True)
+    if endpoint in CSV_ENDPOINTS:
+        data = _columnar(endpoint, session_key, year)
+    else:
+        # Only the frame is memoized, not the response list it was built from.
+        data = normalize(df(_shared(endpoint, {"session_key": session_key})), endpoint)
+    return _with_drivers(data, session_key, year)
+
+@st.cache_resource(show_spinner=False)
+def live_feeds() -> FeedRegistry:
+    return FeedRegistry(upstream)
+
+def session_data(endpoint: str, session_key: int, year: int, live: bool = False) -> pd.DataFrame:
+    """Whole-session data for an endpoint, typed, with driver details merged in.
+
+    Fetched once per session regardless of the Driver/Team filters, and sorted
+    by driver_number so filter_frame() can slice out a driver with a binary
+    search instead of a scan. With live=True, endpoints that support it are
+    read from a shared LiveFeed that only requests rows newer than it has.
+    """
+    try:
+        with metrics.fetching(endpoint):
+            if live and endpoint in LIVE_ENDPOINTS:
+                return _with_drivers(live_feeds().get(endpoint, session_key).refresh(), session_key, year)
+            return _session_data_cached(endpoint, session_key, year)
+    except Exception as e:
+        st.error(f"API error ({endpoint}): {e}")
+        return pd.DataFrame()
+
+def lap_analytics(session_key: int, year: int, live: bool = False) -> LapAnalytics:
+    """analyze_laps() over a whole session's laps and stints, regardless of the
+    Driver/Team filters; kept in memory_cache like the data unless live.
+    Precomputed laps already carry their stints, which are then not fetched."""
+    laps = session_data("laps", session_key, year, live=live)
+    stints = None if "stint_number" in laps.columns else session_data("stints", session_key, year, live=live)
+    with metrics.span("prepare", "lap_analytics"):
+        if live or laps.empty or (stints is not None and stints.empty):  # only cache complete inputs
+            return analyze_laps(laps, stints)
+        return memory_cache.get_or_compute(("lap_analytics", session_key, year), lambda: analyze_laps(laps, stints))
+
+def filter_frame(data: pd.DataFrame, driver_number=None, team: str = None) -> pd.DataFrame:
+    """Apply the sidebar Driver/Team filters to a session_data() frame in memory."""
+    if driver_number is not None and "driver_number" in data.columns:
+        numbers = data["driver_number"].to_numpy()
+        data = data.iloc[numbers.searchsorted(driver_number, "left"):numbers.searchsorted(driver_number, "right")]
+    if team and "team_name" in data.columns:
+        data = data[data["team_name"] == team]
+    return data
+
+# ─── Charts ───────────────────────────────────────────────────────────────────
+@st.cache_resource(show_spinner=False)
+def figure_cache() -> FigureCache:
+    return FigureCache()
+
+def cached_figure(sel: Selection, chart: str, data: pd.DataFrame, build, *key):
+    """The figure build() makes from data, reused while the data and the
+    selection it was filtered by are unchanged; timed as the "figure" stage,
+    with the figure's payload size."""
+    with metrics.span("figure", chart) as detail:
+        key = (chart, sel.session_key, sel.driver_number, sel.team, *key, fingerprint(data))
+        fig, detail["bytes"] = figure_cache().get_or_build(key, build)
+        return fig
+
+def show_chart(fig, name: str):
+    """st.plotly_chart, timed as the "render" stage: the figure is serialized here."""
+    with metrics.span("render", name):
+        st.plotly_chart(fig, use_container_width=True)
+
+PLOTLY_THEME = dict(
+    paper_bgcolor="#0d0d0d",
+    plot_bgcolor="#161616",
+    font_color="#e0e0e0",
+    font_family="DM Sans",
+    xaxis=dict(gridcolor="#2a2a2a", linecolor="#444", tickfont=dict(color="#cccccc")),
+    yaxis=dict(gridcolor="#2a2a2a", linecolor="#444", tickfont=dict(color="#cccccc")),
+    title_font=dict(color="#ffffff", family="Bebas Neue", size=20),
+    legend=dict(font=dict(color="#cccccc")),
+)
@@ -0,0 +1,28 @@
+"""
+The dashboard's views, one module each, imported the first time they are shown.
+
+Every module has a render(sel) that draws the view for a core.Selection.
+Importing them lazily keeps a view's code, and libraries only it uses, out of
+a process until someone opens it:
+
+    views.render("⏱ Lap Times", sel)
+"""
+
+import importlib
+
+VIEWS = {
+    "🏆 Championship": "standings",
+    "📊 Race Results": "results",
+    "⏱ Lap Times": "laps",
+    "🛞 Stints": "stints",
+    "🔧 Pit Stops": "pit",
+    "🏁 Positions": "positions",
+    "🌦 Weather": "weather",
+}
+LABELS = list(VIEWS)
+# Views that follow a running session when live updates are on.
+LIVE_VIEWS = {"⏱ Lap Times", "🔧 Pit Stops", "🏁 Positions", "🌦 Weather"}
+
+
+def render(label: str, sel):
+    importlib.import_module(f"{__name__}.{VIEWS[label]}").render(sel)
@@ -0,0 +1,117 @@
+"""⏱ Lap Times: lap time chart and distribution, race pace and tyre degradation, raw laps."""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard.core import (
+    PLOTLY_THEME, Selection, cached_figure, filter_frame, lap_analytics, session_data, show_chart,
+)
+from f1dash import metrics
+from f1dash.charts import COMPOUND_COLORS, time_series
+from f1dash.laps import FUEL_EFFECT, OUTLIER_FACTOR
+
+STAT_COLUMNS = ["laps", "pace", "best", "degradation", "consistency"]
+
+
+def render_analytics(sel: Selection):
+    """Fuel-corrected pace, degradation and consistency per driver and stint."""
+    analytics = lap_analytics(sel.session_key, sel.year, live=sel.live)
+    with metrics.span("prepare", "laps"):
+        stint_stats = filter_frame(analytics.stints, sel.driver_number, sel.team)
+        driver_stats = analytics.drivers
+        if sel.driver_number:
+            driver_stats = driver_stats[driver_stats["driver_number"] == sel.driver_number]
+        if sel.team and "team_name" in driver_stats.columns:
+            driver_stats = driver_stats[driver_stats["team_name"] == sel.team]
+    if driver_stats.empty:
+        return
+
+    st.markdown('<div class="section-header">Race Pace & Tyre Degradation</div>', unsafe_allow_html=True)
+    st.caption(
+        f"Lap times corrected for fuel ({FUEL_EFFECT:.2f}s per lap of fuel still on board), without lap 1, "
+        f"pit in/out laps and laps over {OUTLIER_FACTOR:.0%} of the driver's median. Degradation is the time "
+        "lost per lap of tyre age within a stint, consistency the spread of lap times around that trend."
+    )
+    name_col = "full_name" if "full_name" in driver_stats.columns else "driver_number"
+    st.dataframe(
+        driver_stats[[name_col, *[c for c in ["team_name"] if c in driver_stats.columns], *STAT_COLUMNS]].round(3),
+        use_container_width=True, hide_index=True,
+    )
+
+    plotted = stint_stats.dropna(subset=["degradation"])
+    if not plotted.empty:
+        def build():
+            fig = px.bar(
+                plotted.assign(compound=plotted["compound"].astype("string").str.upper()),
+                x=name_col, y="degradation", color="compound", barmode="group",
+                color_discrete_map=COMPOUND_COLORS,
+                hover_data=["stint_number", "first_lap", "last_lap", "laps", "consistency"],
+                labels={name_col: "Driver", "degradation": "Degradation (s/lap)", "compound": "Compound"},
+                title="Tyre Degradation by Stint",
+            )
+            fig.update_layout(**PLOTLY_THEME)
+            return fig
+        fig = cached_figure(sel, "degradation", plotted, build)
+        show_chart(fig, "degradation")
+
+    st.dataframe(
+        stint_stats[[name_col, "stint_number", "compound", "first_lap", "last_lap", *STAT_COLUMNS]].round(3),
+        use_container_width=True, hide_index=True,
+    )
+
+
+def render(sel: Selection):
+    if not sel.session_key:
+        st.info("Please select a specific session to view lap times.")
+    else:
+        with st.spinner("Loading lap data…"):
+            laps_df = session_data("laps", sel.session_key, sel.year, live=sel.live)
+        with metrics.span("prepare", "laps"):
+            laps_df = filter_frame(laps_df, sel.driver_number, sel.team)
+
+        if laps_df.empty:
+            st.warning("No lap data available for this session.")
+        else:
+            if "lap_duration" in laps_df.columns and "lap_number" in laps_df.columns:
+                with metrics.span("prepare", "laps"):
+                    laps_plot = laps_df.dropna(subset=["lap_duration"])
+
+                c1, c2, c3 = st.columns(3)
+                c1.metric("Total Laps", int(laps_plot["lap_number"].max()) if not laps_plot.empty else "—")
+                c2.metric("Fastest Lap", f"{laps_plot['lap_duration'].min():.3f}s" if not laps_plot.empty else "—")
+                if "full_name" in laps_plot.columns and not laps_plot.empty:
+                    fastest_driver = laps_plot.loc[laps_plot["lap_duration"].idxmin(), "full_name"]
+                    c3.metric("Fastest Driver", fastest_driver)
+
+                st.markdown('<div class="section-header">Lap Time Chart</div>', unsafe_allow_html=True)
+                color_col = "full_name" if "full_name" in laps_plot.columns else None
+                def build():
+                    fig = time_series(
+                        laps_plot.sort_values("lap_number"),
+                        x="lap_number", y="lap_duration",
+                        color=color_col,
+                        labels={"lap_number": "Lap", "lap_duration": "Time (s)", "full_name": "Driver"},
+                    )
+                    fig.update_layout(**PLOTLY_THEME, title="Lap Times by Lap")
+                    return fig
+                fig = cached_figure(sel, "lap_times", laps_plot, build)
+                show_chart(fig, "lap_times")
+
+                st.markdown('<div class="section-header">Lap Time Distribution</div>', unsafe_allow_html=True)
+                def build():
+                    fig2 = px.box(
+                        laps_plot,
+                        x=color_col if color_col else None,
+                        y="lap_duration",
+                        color=color_col,
+                        labels={"lap_duration": "Lap Time (s)"},
+                    )
+                    fig2.update_layout(**PLOTLY_THEME)
+                    return fig2
+                fig2 = cached_figure(sel, "lap_distribution", laps_plot, build)
+                show_chart(fig2, "lap_distribution")
+
+                render_analytics(sel)
+
+            st.markdown('<div class="section-header">Raw Lap Data</div>', unsafe_allow_html=True)
+            st.dataframe(laps_df, use_container_width=True, hide_index=True)
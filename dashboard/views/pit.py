@@ -0,0 +1,41 @@
+"""🔧 Pit Stops: stop durations per driver."""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard.core import PLOTLY_THEME, Selection, cached_figure, filter_frame, session_data, show_chart
+from f1dash import metrics
+
+
+def render(sel: Selection):
+    if not sel.session_key:
+        st.info("Please select a specific session to view pit stop data.")
+    else:
+        with st.spinner("Loading pit data…"):
+            pit_df = session_data("pit", sel.session_key, sel.year, live=sel.live)
+        with metrics.span("prepare", "pit"):
+            pit_df = filter_frame(pit_df, sel.driver_number, sel.team)
+
+        if pit_df.empty:
+            st.warning("No pit stop data available.")
+        else:
+            c1, c2, c3 = st.columns(3)
+            c1.metric("Total Pit Stops", len(pit_df))
+            if "pit_duration" in pit_df.columns:
+                c2.metric("Fastest Stop", f"{pit_df['pit_duration'].min():.2f}s")
+                c3.metric("Average Stop", f"{pit_df['pit_duration'].mean():.2f}s")
+
+            if "pit_duration" in pit_df.columns and "full_name" in pit_df.columns:
+                st.markdown('<div class="section-header">Pit Stop Duration by Driver</div>', unsafe_allow_html=True)
+                def build():
+                    fig = px.bar(
+                        pit_df.sort_values("pit_duration"),
+                        x="full_name", y="pit_duration", color="full_name",
+                        labels={"full_name": "Driver", "pit_duration": "Duration (s)"},
+                    )
+                    fig.update_layout(**PLOTLY_THEME, showlegend=False)
+                    return fig
+                fig = cached_figure(sel, "pit_durations", pit_df, build)
+                show_chart(fig, "pit_durations")
+
+            st.dataframe(pit_df, use_container_width=True, hide_index=True)
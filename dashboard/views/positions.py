@@ -0,0 +1,41 @@
+"""🏁 Positions: every driver's position over a session."""
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.core import PLOTLY_THEME, Selection, cached_figure, filter_frame, session_data, show_chart
+from f1dash import metrics
+from f1dash.charts import time_series
+
+
+def render(sel: Selection):
+    if not sel.session_key:
+        st.info("Please select a specific session to view position data.")
+    else:
+        with st.spinner("Loading position data…"):
+            pos_df = session_data("position", sel.session_key, sel.year, live=sel.live)
+        with metrics.span("prepare", "position"):
+            pos_df = filter_frame(pos_df, sel.driver_number, sel.team)
+
+        if pos_df.empty:
+            st.warning("No position data available.")
+        else:
+            if "date" in pos_df.columns:
+                with metrics.span("prepare", "position"):
+                    pos_df = pos_df.assign(date=pd.to_datetime(pos_df["date"], errors="coerce"))
+                    pos_df = pos_df.dropna(subset=["date"]).sort_values("date")
+
+            if "position" in pos_df.columns and "date" in pos_df.columns:
+                st.markdown('<div class="section-header">Position Over Time</div>', unsafe_allow_html=True)
+                color_col = "full_name" if "full_name" in pos_df.columns else None
+                def build():
+                    fig = time_series(
+                        pos_df, x="date", y="position",
+                        color=color_col, steps=True,
+                        labels={"date": "Time", "position": "Position", "full_name": "Driver"},
+                    )
+                    fig.update_yaxes(autorange="reversed", dtick=1)
+                    fig.update_layout(**PLOTLY_THEME)
+                    return fig
+                fig = cached_figure(sel, "positions", pos_df, build)
+                show_chart(fig, "positions")
@@ -0,0 +1,69 @@
+"""📊 Race Results: the selected session's classification and the driver grid."""
+
+import streamlit as st
+
+from dashboard.core import Selection, df, fetch
+from f1dash import metrics
+
+
+def render(sel: Selection):
+    result_params = {}
+    if sel.session_key:
+        result_params["session_key"] = sel.session_key
+    elif sel.meeting_key:
+        result_params["meeting_key"] = sel.meeting_key
+
+    if result_params:
+        with st.spinner("Loading session results…"):
+            results_raw = fetch("session_result", result_params)
+        results_df = df(results_raw)
+
+        if not results_df.empty:
+            with metrics.span("prepare", "session_result"):
+                results_df = sel.drivers.attach(results_df, sel.session_key)
+
+            st.markdown('<div class="section-header">Session Results</div>', unsafe_allow_html=True)
+
+            display_df = results_df.copy()
+            if sel.driver_number:
+                display_df = display_df[display_df["driver_number"] == sel.driver_number]
+            if sel.team:
+                display_df = display_df[display_df["team_name"] == sel.team]
+
+            display_cols = [c for c in ["position", "full_name", "team_name", "driver_number"] if c in display_df.columns]
+            if "gap_to_leader" in display_df.columns:
+                display_cols.append("gap_to_leader")
+            if "points" in display_df.columns:
+                display_cols.append("points")
+
+            if not display_df.empty:
+                st.dataframe(display_df[display_cols], use_container_width=True, hide_index=True)
+            else:
+                st.info("No results match the current filters.")
+
+    # Driver grid cards
+    if not sel.drivers_df.empty:
+        st.markdown('<div class="section-header">Driver Grid</div>', unsafe_allow_html=True)
+        filter_d = sel.drivers_df.copy()
+        if sel.driver_number:
+            filter_d = filter_d[filter_d["driver_number"] == sel.driver_number]
+        if sel.team:
+            filter_d = filter_d[filter_d["team_name"] == sel.team]
+
+        filter_d = filter_d.drop_duplicates("driver_number")
+        cols = st.columns(min(4, max(1, len(filter_d))))
+
+        for i, (_, row) in enumerate(filter_d.iterrows()):
+            with cols[i % len(cols)]:
+                color = row["team_colour"]
+                st.markdown(f"""
+                <div style="background:#1a1a1a;border-left:4px solid {color};
+                     border-radius:6px;padding:12px 14px;margin-bottom:10px;">
+                  <div style="font-size:28px;font-family:'Bebas Neue',sans-serif;
+                       letter-spacing:2px;color:{color}"># {row.get('driver_number','')}</div>
+                  <div style="font-size:15px;font-weight:600;color:#ffffff">{row.get('full_name','')}</div>
+                  <div style="font-size:12px;color:#aaaaaa;margin-top:2px">{row.get('team_name','')}</div>
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.info("Select a race and session from the sidebar to see results.")
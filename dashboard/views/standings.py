@@ -0,0 +1,127 @@
+"""🏆 Championship: driver and constructor standings and the points progression."""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard.core import PLOTLY_THEME, Selection, artifacts, cached_figure, df, fetch, show_chart
+from f1dash import metrics
+from f1dash.artifacts import update_standings
+from f1dash.drivers import DriverIndex
+from f1dash.standings import Standings
+
+
+def render_standings_tables(standings: Standings, drivers: DriverIndex):
+    """Render the driver and constructor tables side by side."""
+    col_drv, col_team = st.columns(2)
+
+    with col_drv:
+        st.markdown('<div class="section-header">Drivers</div>', unsafe_allow_html=True)
+        rows_html = ""
+        for rank, (driver, team, pts) in enumerate(standings.drivers.itertuples(index=False), 1):
+            color = drivers.colour(team)
+            badge_class = f"pos-{rank}" if rank <= 3 else ""
+            rows_html += f"""
+            <tr>
+              <td><span class="pos-badge {badge_class}">{rank}</span></td>
+              <td style="border-left: 3px solid {color}; padding-left: 10px;">
+                <strong style="color:#ffffff">{driver}</strong><br>
+                <span style="color:#888;font-size:12px">{team}</span>
+              </td>
+              <td style="font-weight:600;color:#ffffff;font-size:18px">{int(pts)}</td>
+            </tr>"""
+        st.markdown(f"""
+        <table class="champ-table">
+          <thead><tr>
+            <th style="width:50px">#</th>
+            <th>Driver</th>
+            <th>PTS</th>
+          </tr></thead>
+          <tbody>{rows_html}</tbody>
+        </table>""", unsafe_allow_html=True)
+
+    # ── Constructor standings ──────────────────────────────────
+    with col_team:
+        st.markdown('<div class="section-header">Constructors</div>', unsafe_allow_html=True)
+        rows_html = ""
+        for rank, (team, pts) in enumerate(standings.constructors.itertuples(index=False), 1):
+            color = drivers.colour(team)
+            badge_class = f"pos-{rank}" if rank <= 3 else ""
+            rows_html += f"""
+            <tr>
+              <td><span class="pos-badge {badge_class}">{rank}</span></td>
+              <td>
+                <span style="display:inline-block;width:4px;height:32px;background:{color};
+                  border-radius:2px;vertical-align:middle;margin-right:10px;"></span>
+                <strong style="color:#ffffff">{team}</strong>
+              </td>
+              <td style="font-weight:600;color:#ffffff;font-size:18px">{int(pts)}</td>
+            </tr>"""
+        st.markdown(f"""
+        <table class="champ-table">
+          <thead><tr>
+            <th style="width:50px">#</th>
+            <th>Constructor</th>
+            <th>PTS</th>
+          </tr></thead>
+          <tbody>{rows_html}</tbody>
+        </table>""", unsafe_allow_html=True)
+
+
+def render(sel: Selection):
+    st.markdown('<div class="section-header">Driver Championship</div>', unsafe_allow_html=True)
+
+    # Collect all race sessions for the year (the same season sessions list
+    # the driver index is built from)
+    with st.spinner("Building championship standings…"):
+        season_sessions_df = df(fetch("sessions", {"year": sel.year}))
+    all_sessions_df = season_sessions_df
+    if "session_name" in all_sessions_df.columns:
+        all_sessions_df = all_sessions_df[all_sessions_df["session_name"] == "Race"]
+
+    # The championship is persistent state, extended race by race: results are
+    # only fetched (in one session_key range request) for races it does not
+    # cover yet, or whose results may still change. The points engine joins
+    # them with the season driver index and the meetings the sidebar loaded.
+    with metrics.span("prepare", "standings"):
+        standings = update_standings(
+            artifacts(), sel.year, all_sessions_df,
+            lambda params: df(fetch("session_result", params)),
+            sel.drivers.table, sel.meetings,
+        )
+
+    # ── Driver standings table ──────────────────────────────────────
+    if not standings.drivers.empty:
+        render_standings_tables(standings, sel.drivers)
+
+        # ── Points progression chart ────────────────────────────────
+        if not standings.progression.empty:
+            st.markdown('<div class="section-header">Points Progression</div>', unsafe_allow_html=True)
+            prog_df = standings.progression
+
+            # Filter by driver/team if selected
+            if sel.driver_number and not sel.drivers_df.empty:
+                drv_names = sel.drivers_df.loc[sel.drivers_df["driver_number"] == sel.driver_number, "full_name"]
+                if not drv_names.empty:
+                    prog_df = prog_df[prog_df["driver"] == drv_names.iloc[0]]
+            if sel.team:
+                prog_df = prog_df[prog_df["team"] == sel.team]
+
+            if not prog_df.empty:
+                def build():
+                    fig = px.line(
+                        prog_df,
+                        x="race", y="cumulative_points",
+                        color="driver",
+                        markers=True,
+                        category_orders={"race": standings.races},
+                        labels={"race": "Race", "cumulative_points": "Points", "driver": "Driver"},
+                        title="Cumulative Points — Season Progression",
+                    )
+                    fig.update_layout(**PLOTLY_THEME, height=420)
+                    fig.update_traces(line_width=2.5)
+                    return fig
+                fig = cached_figure(sel, "points_progression", prog_df, build, tuple(standings.races))
+                show_chart(fig, "points_progression")
+
+    else:
+        st.info("No race results available yet for this season. Check back once the season begins, or select a past season.")
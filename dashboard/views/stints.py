@@ -0,0 +1,37 @@
+"""🛞 Stints: tyre strategy of a session as a Gantt chart."""
+
+import streamlit as st
+
+from dashboard.core import PLOTLY_THEME, Selection, cached_figure, filter_frame, session_data, show_chart
+from f1dash import metrics
+from f1dash.charts import stint_gantt
+
+
+def render(sel: Selection):
+    if not sel.session_key:
+        st.info("Please select a specific session to view stints.")
+    else:
+        with st.spinner("Loading stint data…"):
+            stints_df = session_data("stints", sel.session_key, sel.year, live=sel.live)
+        with metrics.span("prepare", "stints"):
+            stints_df = filter_frame(stints_df, sel.driver_number, sel.team)
+
+        if stints_df.empty:
+            st.warning("No stint data available.")
+        else:
+            st.markdown('<div class="section-header">Tyre Strategy</div>', unsafe_allow_html=True)
+            if {"lap_start","lap_end","full_name","compound"}.issubset(stints_df.columns):
+                def build():
+                    fig = stint_gantt(stints_df)
+                    fig.update_layout(
+                        barmode="overlay",
+                        title="Tyre Strategy (Gantt)",
+                        xaxis_title="Lap Number",
+                        yaxis_title="Driver",
+                        **PLOTLY_THEME,
+                    )
+                    return fig
+                fig = cached_figure(sel, "tyre_strategy", stints_df, build)
+                show_chart(fig, "tyre_strategy")
+
+            st.dataframe(stints_df, use_container_width=True, hide_index=True)
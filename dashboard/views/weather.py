@@ -0,0 +1,63 @@
+"""🌦 Weather: temperatures, wind and humidity over a session."""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from dashboard.core import PLOTLY_THEME, Selection, cached_figure, session_data, show_chart
+from f1dash import metrics
+
+
+def render(sel: Selection):
+    if not sel.session_key:
+        st.info("Please select a specific session to view weather data.")
+    else:
+        with st.spinner("Loading weather data…"):
+            weather_df = session_data("weather", sel.session_key, sel.year, live=sel.live)
+
+        if weather_df.empty:
+            st.warning("No weather data available.")
+        else:
+            if "date" in weather_df.columns:
+                with metrics.span("prepare", "weather"):
+                    weather_df = weather_df.assign(date=pd.to_datetime(weather_df["date"], errors="coerce"))
+                    weather_df = weather_df.dropna(subset=["date"]).sort_values("date")
+
+            numeric_cols = ["air_temperature", "track_temperature", "humidity",
+                            "wind_speed", "rainfall", "pressure"]
+            available = [c for c in numeric_cols if c in weather_df.columns]
+
+            if available:
+                c1, c2, c3 = st.columns(3)
+                if "air_temperature" in weather_df.columns:
+                    c1.metric("Avg Air Temp", f"{weather_df['air_temperature'].mean():.1f}°C")
+                if "track_temperature" in weather_df.columns:
+                    c2.metric("Avg Track Temp", f"{weather_df['track_temperature'].mean():.1f}°C")
+                if "humidity" in weather_df.columns:
+                    c3.metric("Avg Humidity", f"{weather_df['humidity'].mean():.1f}%")
+
+                st.markdown('<div class="section-header">Temperature Over Session</div>', unsafe_allow_html=True)
+                temp_cols = [c for c in ["air_temperature","track_temperature"] if c in weather_df.columns]
+                if temp_cols and "date" in weather_df.columns:
+                    def build():
+                        fig = px.line(
+                            weather_df.melt(id_vars="date", value_vars=temp_cols),
+                            x="date", y="value", color="variable",
+                            labels={"date":"Time","value":"Temperature (°C)","variable":"Sensor"},
+                        )
+                        fig.update_layout(**PLOTLY_THEME)
+                        return fig
+                    fig = cached_figure(sel, "temperature", weather_df, build)
+                    show_chart(fig, "temperature")
+
+                if "wind_speed" in weather_df.columns and "date" in weather_df.columns:
+                    st.markdown('<div class="section-header">Wind Speed</div>', unsafe_allow_html=True)
+                    def build():
+                        fig2 = px.area(weather_df, x="date", y="wind_speed",
+                                       labels={"date":"Time","wind_speed":"Wind Speed (m/s)"})
+                        fig2.update_layout(**PLOTLY_THEME)
+                        return fig2
+                    fig2 = cached_figure(sel, "wind", weather_df, build)
+                    show_chart(fig2, "wind")
+
+            st.dataframe(weather_df, use_container_width=True, hide_index=True)
@@ -0,0 +1 @@
+"""Support code for the OpenF1 dashboard that does not depend on Streamlit."""
@@ -0,0 +1,263 @@
+"""
+Precomputed season artifacts: the championship state and per-race lap frames.
+
+The championship is derived from a whole season of results, which is the
+slowest thing the dashboard computes on a user's request. It is instead kept
+as persistent state per season and only ever extended: update_standings()
+fetches the results of races the state does not cover yet (plus the latest
+race while stewards can still change it) and folds them in. The state and
+the lap/stint frame of every settled race live in a directory of Parquet files:
+
+    <store>/2025/standings.parquet       race-by-race points; the metadata
+                                         lists races and session_keys covered
+    <store>/2025/laps/<session_key>.parquet
+
+A scheduled job can keep a store up to date ahead of users:
+
+    python -m openf1_dashboard precompute --season 2025 --out ./openf1-artifacts
+
+With OPENF1_ARTIFACTS pointing at it, the dashboard reads the same store;
+without, it keeps its own under the cache directory. Each file is replaced
+atomically, so readers and writers in any number of processes never see a
+half-written season.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from f1dash.cache import CACHE_DIR, LIVE_TTL, SETTLE_AFTER
+from f1dash.drivers import DriverIndex
+from f1dash.laps import attach_stints
+from f1dash.schema import normalize
+from f1dash.standings import (
+    Standings, compute_standings, fold_standings, season_race_results, standings_from_progression,
+)
+
+log = logging.getLogger(__name__)
+
+ARTIFACTS_DIR = os.environ.get("OPENF1_ARTIFACTS")
+STATE_KEY = b"openf1.standings"  # Parquet metadata key of the state's manifest
+
+
+def _frame(rows: list, endpoint: str = None) -> pd.DataFrame:
+    data = pd.DataFrame(rows) if rows else pd.DataFrame()
+    return normalize(data, endpoint) if endpoint else data
+
+
+def _span(keys) -> dict:
+    return {"session_key>=": int(min(keys)), "session_key<=": int(max(keys))}
+
+
+class ArtifactStore:
+    """A directory of precomputed artifacts, one subdirectory per season."""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or ARTIFACTS_DIR or os.path.join(CACHE_DIR, "artifacts")
+        self.checked: dict = {}  # year -> (when, standings) of the last update_standings()
+
+    def path(self, year: int, name: str) -> str:
+        return os.path.join(self.directory, str(year), name)
+
+    def _replace(self, path: str, table: pa.Table):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+
+    def write_frame(self, year: int, name: str, frame: pd.DataFrame):
+        self._replace(self.path(year, f"{name}.parquet"), pa.Table.from_pandas(frame, preserve_index=False))
+
+    def read_frame(self, year: int, name: str) -> pd.DataFrame:
+        path = self.path(year, f"{name}.parquet")
+        return pd.read_parquet(path) if os.path.exists(path) else None
+
+    def write_standings(self, year: int, standings: Standings, **manifest):
+        manifest = {"season": year, "built_at": datetime.now(timezone.utc).isoformat(),
+                    "races": standings.races, **manifest}
+        table = pa.Table.from_pandas(standings.progression, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, STATE_KEY: json.dumps(manifest).encode()})
+        self._replace(self.path(year, "standings.parquet"), table)
+
+    def manifest(self, year: int) -> dict:
+        """What the stored state of a season covers, or None if there is none."""
+        path = self.path(year, "standings.parquet")
+        if not os.path.exists(path):
+            return None
+        return json.loads((pq.read_schema(path).metadata or {}).get(STATE_KEY, b"null"))
+
+    def standings(self, year: int) -> Standings:
+        """The stored standings of a season, or None if it has not been built."""
+        path = self.path(year, "standings.parquet")
+        if not os.path.exists(path):
+            return None
+        table = pq.read_table(path)
+        manifest = json.loads((table.schema.metadata or {}).get(STATE_KEY, b"null"))
+        if manifest is None or "session_key" not in table.column_names:
+            return None  # none, or saved without the calendar order of its rows: rebuild
+        return standings_from_progression(table.to_pandas(), manifest["races"])
+
+    def modified(self, year: int, name: str) -> datetime:
+        """When an artifact was last written, or None if it does not exist."""
+        path = self.path(year, f"{name}.parquet")
+        if not os.path.exists(path):
+            return None
+        return datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+
+    def session_laps(self, year: int, session_key: int) -> pd.DataFrame:
+        """Laps of a session with their stints attached, or None if not built."""
+        return self.read_frame(year, f"laps/{session_key}")
+
+
+def _same(a: Standings, b: Standings) -> bool:
+    """True if two standings have the same races and progression, whatever the dtypes."""
+    if a is None or b is None or a.races != b.races or a.progression.shape != b.progression.shape:
+        return False
+    return all(
+        (a.progression[col].astype(str).to_numpy() == b.progression[col].astype(str).to_numpy()).all()
+        for col in a.progression.columns
+    )
+
+
+def update_standings(
+    store: ArtifactStore,
+    year: int,
+    race_sessions: pd.DataFrame,
+    fetch_results: Callable[[dict], pd.DataFrame],
+    drivers: pd.DataFrame,
+    meetings: pd.DataFrame,
+    now: datetime = None,
+) -> Standings:
+    """The season's standings, fetching results only for races not folded in yet.
+
+    race_sessions are the season's Race sessions; those that have started and
+    are not in the stored state are pending, and so is any race that ended
+    less than SETTLE_AFTER ago. A race is only fetched once drivers and
+    meetings know its session and meeting, so a failed lookup is retried
+    later instead of being stored as driver "#44" of team "Unknown".
+    fetch_results(params) returns session_result rows for a session_key
+    range; it is only called when something is pending.
+
+    The state is written back when it changed; if that fails (e.g. a
+    read-only OPENF1_ARTIFACTS) the result is still returned. Each result is
+    kept in store.checked for LIVE_TTL, so a race that is still settling is
+    re-read at most that often, not on every call.
+    """
+    now = now or datetime.now(timezone.utc)
+    checked = store.checked.get(year)
+    if checked is not None and timedelta(0) <= now - checked[0] < timedelta(seconds=LIVE_TTL):
+        return checked[1]
+
+    manifest = store.manifest(year)
+    stored = store.standings(year) if manifest else None
+    done = set(manifest.get("sessions", [])) if stored is not None else set()
+    standings = stored if stored is not None else compute_standings(pd.DataFrame())
+
+    if not race_sessions.empty and "session_key" in race_sessions.columns:
+        start = pd.to_datetime(race_sessions.get("date_start"), errors="coerce", utc=True)
+        end = pd.to_datetime(race_sessions.get("date_end"), errors="coerce", utc=True)
+        keys = race_sessions["session_key"].astype(int)
+        named = meetings is not None and {"meeting_key", "meeting_name"}.issubset(meetings.columns)
+        joinable = keys.isin(drivers.get("session_key", [])) & pd.Series(
+            race_sessions.get("meeting_key"), index=race_sessions.index,
+        ).isin(meetings["meeting_key"] if named else [])
+        pending = race_sessions[(start <= now) & joinable & (~keys.isin(done) | ~(end + SETTLE_AFTER <= now))]
+
+        if not pending.empty:
+            results = season_race_results(fetch_results(_span(pending["session_key"])), drivers, pending, meetings)
+            if not results.empty:
+                standings = compute_standings(results) if stored is None else fold_standings(stored, results)
+                covered = done | {int(k) for k in results["session_key"].unique()}
+                if covered != done or not _same(standings, stored):
+                    try:
+                        store.write_standings(year, standings, sessions=sorted(covered),
+                                              last_session_key=max(covered))
+                    except OSError as e:
+                        log.warning("could not save the %s championship state in %s: %s", year, store.directory, e)
+
+    store.checked[year] = (now, standings)
+    return standings
+
+
+def precompute_season(year: int, store: ArtifactStore, loader=None, laps: bool = True,
+                      now: datetime = None) -> dict:
+    """Bring a season's standings and per-race lap frames up to date; return a summary.
+
+    A race's lap frame is only built once the race has settled (ended more
+    than SETTLE_AFTER ago), and rebuilt if it was written before that.
+    """
+    now = now or datetime.now(timezone.utc)
+    if loader is None:
+        from f1dash.client import get_json as loader
+
+    sessions = _frame(loader("sessions", {"year": year}))
+    if sessions.empty or "session_key" not in sessions.columns:
+        return {"races": 0}
+    meetings = _frame(loader("meetings", {"year": year}))
+    drivers = DriverIndex(_frame(loader("drivers", _span(sessions["session_key"]))))
+    races = sessions[sessions["session_name"] == "Race"] if "session_name" in sessions.columns else sessions.iloc[0:0]
+
+    fetched = []
+
+    def fetch_results(params):
+        fetched.append(params)
+        return _frame(loader("session_result", params), "session_result")
+
+    standings = update_standings(store, year, races, fetch_results, drivers.table, meetings, now=now)
+    manifest = store.manifest(year) or {}
+    settled_at = dict(zip(
+        races["session_key"].astype(int),
+        pd.to_datetime(races.get("date_end"), errors="coerce", utc=True) + SETTLE_AFTER,
+    ))
+
+    built = 0
+    for session_key in manifest.get("sessions", []) if laps else []:
+        settled = settled_at.get(session_key)
+        if settled is None or pd.isna(settled) or settled > now:
+            continue  # still running or settling: its laps can change
+        written = store.modified(year, f"laps/{session_key}")
+        if written is not None and written >= settled:
+            continue  # a settled race's laps do not change
+        frame = attach_stints(
+            _frame(loader("laps", {"session_key": session_key}), "laps"),
+            _frame(loader("stints", {"session_key": session_key}), "stints"),
+        )
+        store.write_frame(year, f"laps/{session_key}", drivers.attach(frame, session_key))
+        built += 1
+    return {"races": len(standings.races), "last_session_key": manifest.get("last_session_key"),
+            "results_fetched": len(fetched), "lap_frames": built}
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+def main(argv=None, prog: str = "python -m f1dash.artifacts"):
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    precompute = commands.add_parser("precompute", help="bring standings and lap artifacts of seasons up to date")
+    precompute.add_argument("--season", type=int, action="append", required=True, help="season year (repeatable)")
+    precompute.add_argument("--out", default=ARTIFACTS_DIR or "openf1-artifacts", help="artifact directory")
+    precompute.add_argument("--no-laps", dest="laps", action="store_false", help="only build the standings")
+    args = parser.parse_args(argv)
+
+    from f1dash.bundle import BUNDLE_DIR, BundleStore
+
+    # Build from the offline bundle when one is configured, like the dashboard.
+    loader = BundleStore(BUNDLE_DIR).query if BUNDLE_DIR else None
+    store = ArtifactStore(args.out)
+    for year in args.season:
+        started = time.perf_counter()
+        summary = precompute_season(year, store, loader, laps=args.laps)
+        print(f"{year}: " + ", ".join(f"{k} {v}" for k, v in summary.items())
+              + f" ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
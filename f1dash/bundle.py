@@ -0,0 +1,177 @@
+"""
+Offline season bundles: export OpenF1 to Parquet, and replay it with no network.
+
+A bundle is a directory with one Parquet file per endpoint per season:
+
+    <bundle>/2024/meetings.parquet
+    <bundle>/2024/laps.parquet
+    ...
+
+Export a season (needs access to BASE_URL):
+
+    python -m f1dash.bundle export --season 2024 --out ./openf1-bundle
+
+and run the dashboard from it by setting OPENF1_BUNDLE=./openf1-bundle.
+BundleStore.query() answers the same (endpoint, params) requests as the API,
+including comparison filters such as ``session_key>=9000``, so it can stand
+in for client.get_json anywhere a loader is accepted; BundleStore.frame()
+returns the same rows as a DataFrame straight from Arrow, without building
+them as Python objects first. pyarrow.parquet is imported when a bundle is
+first written or read, not by importing this module for BUNDLE_DIR.
+"""
+
+import argparse
+import glob
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+BUNDLE_DIR = os.environ.get("OPENF1_BUNDLE")
+SESSION_ENDPOINTS = ("drivers", "session_result", "laps", "stints", "pit", "position", "weather")
+EXPORT_WORKERS = 4
+# Metadata key listing columns stored as JSON text because their values mix
+# types (e.g. session_result.gap_to_leader is a number or "+1 LAP").
+JSON_COLUMNS = b"openf1.json_columns"
+
+_OPERATORS = {">=": pc.greater_equal, "<=": pc.less_equal, ">": pc.greater, "<": pc.less}
+
+
+# ── writing ───────────────────────────────────────────────────────────────────
+def to_table(rows: list) -> pa.Table:
+    """Build an Arrow table from API rows, keeping every column they use."""
+    columns = list(dict.fromkeys(k for row in rows for k in row))
+    arrays, encoded = {}, []
+    for col in columns:
+        values = [row.get(col) for row in rows]
+        try:
+            arrays[col] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[col] = pa.array([None if v is None else json.dumps(v) for v in values], pa.string())
+            encoded.append(col)
+    table = pa.table(arrays)
+    return table.replace_schema_metadata({JSON_COLUMNS: json.dumps(encoded).encode()})
+
+
+def write_endpoint(path: str, rows: list):
+    if not rows:
+        return
+    import pyarrow.parquet as pq
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(to_table(rows), path, compression="zstd")
+
+
+def export_season(year: int, out: str, loader=None) -> dict:
+    """Snapshot every endpoint the dashboard uses for one season; return row counts."""
+    if loader is None:
+        from f1dash.client import get_json as loader
+
+    season_dir = os.path.join(out, str(year))
+    meetings = loader("meetings", {"year": year})
+    sessions = loader("sessions", {"year": year})
+    counts = {"meetings": len(meetings), "sessions": len(sessions)}
+    write_endpoint(os.path.join(season_dir, "meetings.parquet"), meetings)
+    write_endpoint(os.path.join(season_dir, "sessions.parquet"), sessions)
+
+    keys = [s["session_key"] for s in sessions if "session_key" in s]
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool:
+        for endpoint in SESSION_ENDPOINTS:
+            batches = pool.map(loader, [endpoint] * len(keys), [{"session_key": sk} for sk in keys])
+            rows = [row for batch in batches for row in batch]
+            counts[endpoint] = len(rows)
+            write_endpoint(os.path.join(season_dir, f"{endpoint}.parquet"), rows)
+    return counts
+
+
+# ── replay ────────────────────────────────────────────────────────────────────
+def _scalar(value):
+    return value.item() if hasattr(value, "item") else value
+
+
+class BundleStore:
+    """Read-only OpenF1 stand-in backed by an exported bundle."""
+
+    def __init__(self, directory: str = BUNDLE_DIR):
+        if not directory or not os.path.isdir(directory):
+            raise FileNotFoundError(f"OpenF1 bundle not found: {directory!r}")
+        self.directory = directory
+        self._tables: dict = {}
+        self._lock = threading.Lock()
+
+    def tables(self, endpoint: str) -> list:
+        """One table per season for an endpoint, loaded on first use."""
+        import pyarrow.parquet as pq
+
+        with self._lock:
+            if endpoint not in self._tables:
+                paths = sorted(glob.glob(os.path.join(self.directory, "*", f"{endpoint}.parquet")))
+                self._tables[endpoint] = [pq.read_table(p) for p in paths]
+            return self._tables[endpoint]
+
+    def query(self, endpoint: str, params: dict = None) -> list:
+        """Rows matching params, as the API would return them."""
+        rows = []
+        for table in self.tables(endpoint):
+            rows.extend(_select(table, params or {}))
+        return rows
+
+    def frame(self, endpoint: str, params: dict = None) -> pd.DataFrame:
+        """Rows matching params as a DataFrame; JSON-encoded columns stay text."""
+        tables = [t for t in (_filter(table, params or {}) for table in self.tables(endpoint)) if t is not None]
+        if not tables:
+            return pd.DataFrame()
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+
+def _filter(table: pa.Table, params: dict) -> pa.Table:
+    """The rows of table matching params; None if it lacks a filtered column."""
+    mask = None
+    for key, value in params.items():
+        name = key.rstrip("<>=")
+        if name not in table.column_names:
+            return None
+        column = table[name]
+        value = _scalar(value)
+        if pa.types.is_string(column.type):
+            value = str(value)
+        elif isinstance(value, str):
+            value = pa.scalar(value).cast(column.type)
+        cond = _OPERATORS.get(key[len(name):], pc.equal)(column, value)
+        mask = cond if mask is None else pc.and_(mask, cond)
+    return table if mask is None else table.filter(mask)
+
+
+def _select(table: pa.Table, params: dict) -> list:
+    selected = _filter(table, params)
+    if selected is None:
+        return []
+    rows = selected.to_pylist()
+    # Columns are JSON-encoded per file, since each season is written on its own.
+    for col in json.loads((table.schema.metadata or {}).get(JSON_COLUMNS, b"[]")):
+        for row in rows:
+            if row.get(col) is not None:
+                row[col] = json.loads(row[col])
+    return rows
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m f1dash.bundle", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="snapshot seasons from the API into a bundle")
+    export.add_argument("--season", type=int, action="append", required=True, help="season year (repeatable)")
+    export.add_argument("--out", default=BUNDLE_DIR or "openf1-bundle", help="bundle directory")
+    args = parser.parse_args(argv)
+
+    for year in args.season:
+        counts = export_season(year, args.out)
+        print(f"{year}: " + ", ".join(f"{ep} {n}" for ep, n in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
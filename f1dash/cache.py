@@ -0,0 +1,239 @@
+"""
+Shared, persistent cache for OpenF1 responses.
+
+Responses are stored in a key/value backend keyed by endpoint + params. The
+backend only needs the small part of the Redis API used here —
+``get(key)``, ``set(key, value, ex=None, nx=False)`` and ``delete(key)`` —
+so a real Redis client can be used as-is when several replicas should share
+one cache (OPENF1_REDIS_URL), and SQLiteBackend stands in for it otherwise
+(a file that survives restarts and can sit on a volume shared by replicas).
+
+Payloads are stored zlib-compressed: JSON responses re-encoded, CSV responses
+(requested with ``csv=true``, see f1dash.ingest) as the bytes received.
+
+Data for a weekend that finished more than SETTLE_AFTER ago never changes
+again, so it is kept forever; anything else (the current weekend, the current
+season's lists, sessions we know nothing about yet) expires after LIVE_TTL.
+
+ResponseCache.get_or_fetch() is single-flight: concurrent misses for the same
+key, whether from threads in this process or from other replicas, result in
+exactly one upstream call while the others wait for its result.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+CACHE_DIR = os.environ.get(
+    "OPENF1_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "openf1-dashboard")
+)
+REDIS_URL = os.environ.get("OPENF1_REDIS_URL")
+LIVE_TTL = int(os.environ.get("OPENF1_LIVE_TTL", 300))
+# Stewards' decisions can still change results for a few hours after a weekend.
+SETTLE_AFTER = timedelta(hours=6)
+# How long a fetch may hold the single-flight lock before others give up waiting.
+LOCK_TTL = 30
+LOCK_POLL = 0.05
+
+
+def _scalar(value):
+    """JSON fallback: numpy scalars as their Python value, anything else as str."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def cache_key(endpoint: str, params: dict = None) -> str:
+    # numpy and Python ints must produce the same key: values taken from a
+    # DataFrame and values from raw JSON select the same data.
+    return f"{endpoint}?{json.dumps(params or {}, sort_keys=True, default=_scalar)}"
+
+
+def is_csv(params: dict = None) -> bool:
+    """True if params ask OpenF1 for CSV rather than JSON."""
+    return str((params or {}).get("csv", "")).lower() == "true"
+
+
+def _base_key(key: str) -> str:
+    """Strip a trailing comparison operator: "session_key>=" -> "session_key"."""
+    return key.rstrip("<>=")
+
+
+def _parse_date(value) -> datetime:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class SQLiteBackend:
+    """Local stand-in for the Redis get/set/delete subset, backed by SQLite.
+
+    Safe to share between threads and, via WAL mode, between processes using
+    the same file.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "openf1.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value, ex: float = None, nx: bool = False) -> bool:
+        if isinstance(value, str):
+            value = value.encode()
+        now = time.time()
+        expires_at = None if ex is None else now + ex
+        with self._lock, self._conn:
+            if not nx:
+                self._conn.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?)", (key, value, expires_at))
+                return True
+            self._conn.execute("DELETE FROM kv WHERE key = ? AND expires_at <= ?", (key, now))
+            cur = self._conn.execute("INSERT OR IGNORE INTO kv VALUES (?, ?, ?)", (key, value, expires_at))
+            return cur.rowcount == 1
+
+    def delete(self, key: str) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM kv WHERE key = ?", (key,)).rowcount
+
+
+def backend_from_env():
+    """Redis when OPENF1_REDIS_URL is set, otherwise the local SQLite file."""
+    if REDIS_URL:
+        import redis  # optional dependency, only needed for a shared Redis cache
+
+        return redis.Redis.from_url(REDIS_URL)
+    return SQLiteBackend(CACHE_DIR)
+
+
+class ResponseCache:
+    """OpenF1 response cache with TTL policy and single-flight fetching."""
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else backend_from_env()
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
+
+    # ── payloads ──────────────────────────────────────────────────────────
+    def get(self, endpoint: str, params: dict = None):
+        """Return the cached payload, or None on a miss or expired entry."""
+        payload = self.backend.get("resp:" + cache_key(endpoint, params))
+        if payload is None:
+            return None
+        payload = zlib.decompress(payload)
+        return payload if is_csv(params) else json.loads(payload)
+
+    def put(self, endpoint: str, params: dict, data):
+        if endpoint == "sessions":
+            self.record_sessions(data)
+        ttl = None if self.is_settled(params) else LIVE_TTL
+        payload = data if isinstance(data, bytes) else json.dumps(data).encode()
+        self.backend.set("resp:" + cache_key(endpoint, params), zlib.compress(payload), ex=ttl)
+
+    def get_or_fetch(self, endpoint: str, params: dict, loader: Callable) -> list:
+        """Cached payload, or loader(endpoint, params) run once across all waiters."""
+        data = self.get(endpoint, params)
+        if data is not None:
+            return data
+
+        key = cache_key(endpoint, params)
+        with self._inflight_lock:
+            local = self._inflight.setdefault(key, threading.Lock())
+        with local:
+            try:
+                data = self.get(endpoint, params)
+                if data is not None:
+                    return data
+                return self._fetch_once(key, endpoint, params, loader)
+            finally:
+                with self._inflight_lock:
+                    if self._inflight.get(key) is local:
+                        del self._inflight[key]
+
+    def _fetch_once(self, key: str, endpoint: str, params: dict, loader: Callable) -> list:
+        lock_key, token = "lock:" + key, uuid.uuid4().hex
+        deadline = time.time() + LOCK_TTL
+        # Another replica is fetching this key: wait for its result, or for
+        # its lock to expire if it died mid-request.
+        while not self.backend.set(lock_key, token, ex=LOCK_TTL, nx=True):
+            time.sleep(LOCK_POLL)
+            data = self.get(endpoint, params)
+            if data is not None:
+                return data
+            if time.time() > deadline:
+                break
+        try:
+            data = loader(endpoint, params)
+            self.put(endpoint, params, data)
+            return data
+        finally:
+            owner = self.backend.get(lock_key)
+            if owner is not None and (owner.decode() if isinstance(owner, bytes) else owner) == token:
+                self.backend.delete(lock_key)
+
+    # ── TTL policy ────────────────────────────────────────────────────────
+    def record_sessions(self, sessions: list):
+        """Remember which weekend each session belongs to and when it ends."""
+        ends: dict = {}
+        for s in sessions:
+            if not isinstance(s, dict) or "session_key" not in s or s.get("meeting_key") is None:
+                continue
+            mk = s["meeting_key"]
+            key = f"session:{s['session_key']}:meeting"
+            if self.backend.get(key) != str(mk).encode():
+                self.backend.set(key, str(mk))
+            end = _parse_date(s.get("date_end"))
+            if end is not None and (mk not in ends or end > ends[mk]):
+                ends[mk] = end
+        for mk, end in ends.items():
+            known = self.backend.get(f"meeting:{mk}:end")
+            known = _parse_date(known.decode() if isinstance(known, bytes) else known)
+            if known is None or end > known:
+                self.backend.set(f"meeting:{mk}:end", end.isoformat())
+
+    def is_settled(self, params: dict = None) -> bool:
+        """True if the data the params select can no longer change upstream."""
+        params = params or {}
+        now = datetime.now(timezone.utc)
+        scoped = {_base_key(k): v for k, v in params.items()}
+
+        if "year" in scoped:
+            try:
+                return int(scoped["year"]) < now.year
+            except (TypeError, ValueError):
+                return False
+
+        # A session is only as settled as the weekend it belongs to.
+        meeting_key = scoped.get("meeting_key")
+        if meeting_key is None and "session_key" in scoped:
+            keys = [v for k, v in params.items() if _base_key(k) == "session_key"]
+            meeting_key = self.backend.get(f"session:{max(keys)}:meeting")
+            if isinstance(meeting_key, bytes):
+                meeting_key = meeting_key.decode()
+        if meeting_key is None:
+            return False
+
+        end = self.backend.get(f"meeting:{meeting_key}:end")
+        end = _parse_date(end.decode() if isinstance(end, bytes) else end)
+        return end is not None and end + SETTLE_AFTER < now
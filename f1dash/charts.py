@@ -0,0 +1,136 @@
+"""
+Figure builders for the heavier charts.
+
+The builders return bare Plotly figures; the dashboard applies its theme on top.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+COMPOUND_COLORS = {
+    "SOFT": "#e8002d", "MEDIUM": "#ffd900", "HARD": "#f0f0f0",
+    "INTERMEDIATE": "#39b54a", "WET": "#0067ff",
+}
+
+
+def stint_gantt(stints: pd.DataFrame) -> go.Figure:
+    """Tyre strategy Gantt chart with one bar trace per compound.
+
+    Every stint of a compound goes into the same trace via array-valued
+    base/x/y/customdata, so the trace count stays at the number of compounds
+    used rather than growing with drivers × stints.
+    """
+    data = stints.dropna(subset=["lap_start", "lap_end"])
+    compound = data["compound"].astype("string").fillna("")
+
+    fig = go.Figure()
+    for name, group in data.groupby(compound.str.upper(), sort=False):
+        fig.add_trace(go.Bar(
+            x=(group["lap_end"] - group["lap_start"]).to_numpy(),
+            base=group["lap_start"].to_numpy(),
+            y=group["full_name"].to_numpy(),
+            orientation="h",
+            marker_color=COMPOUND_COLORS.get(name, "#888"),
+            name=name,
+            customdata=pd.concat(
+                [compound[group.index], group["lap_start"], group["lap_end"]], axis=1
+            ).to_numpy(),
+            hovertemplate=(
+                "<b>%{y}</b><br>"
+                "Compound: %{customdata[0]}<br>"
+                "Laps: %{customdata[1]}–%{customdata[2]}<extra></extra>"
+            ),
+            showlegend=False,
+        ))
+    # Keep drivers in data order, as the one-trace-per-stint chart did.
+    fig.update_yaxes(categoryorder="array", categoryarray=data["full_name"].drop_duplicates().tolist())
+    return fig
+
+
+# ─── Large time series ───────────────────────────────────────────────────────
+# Above WEBGL_THRESHOLD raw points a figure is drawn with Scattergl, and no
+# figure carries more than MAX_POINTS points after downsampling (roughly
+# 40 bytes each once serialized, so ~320 KB per chart at most).
+WEBGL_THRESHOLD = 1000
+MAX_POINTS = 8000
+MIN_POINTS_PER_TRACE = 100
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the shape.
+
+    x must be numeric and ascending. The first and last points are always kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(float)
+    y = y.astype(float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex.
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[nxt_lo:nxt_hi].mean(), y[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(area.argmax())
+        out[i + 1] = prev
+    return out
+
+
+def step_boundaries(frame: pd.DataFrame, y: str, group: str = None) -> pd.DataFrame:
+    """Drop samples in the middle of runs of equal values.
+
+    The first and last sample of every run is kept, so a line drawn through
+    the result is identical to one through the full data. Position feeds are
+    mostly such runs, which makes this lossless compression very effective.
+    """
+    if frame.empty:
+        return frame
+    values = frame[y]
+    series = frame.groupby(group, sort=False, observed=True)[y] if group else values
+    starts = values.ne(series.shift(1))
+    ends = values.ne(series.shift(-1))
+    return frame[starts | ends]
+
+
+def downsample(frame: pd.DataFrame, x: str, y: str, group: str = None, max_points: int = MAX_POINTS) -> pd.DataFrame:
+    """LTTB-downsample each group so the whole frame fits in max_points rows."""
+    if len(frame) <= max_points:
+        return frame
+    groups = [g for _, g in frame.groupby(group, sort=False, observed=True)] if group else [frame]
+    per_trace = max(MIN_POINTS_PER_TRACE, max_points // len(groups))
+    parts = []
+    for g in groups:
+        g = g.dropna(subset=[x, y])
+        xs = g[x]
+        xs = xs.astype("int64") if pd.api.types.is_datetime64_any_dtype(xs) else pd.to_numeric(xs)
+        parts.append(g.iloc[lttb_indices(xs.to_numpy(), g[y].to_numpy(), per_trace)])
+    return pd.concat(parts)
+
+
+def time_series(
+    frame: pd.DataFrame, x: str, y: str, color: str = None, steps: bool = False, **px_kwargs
+) -> go.Figure:
+    """px.line for potentially large series: compressed, downsampled, WebGL when big.
+
+    Set steps=True for piecewise-constant data (e.g. positions) to drop
+    redundant samples losslessly before any lossy downsampling. The frame
+    must already be sorted by x.
+    """
+    raw_points = len(frame)
+    data = step_boundaries(frame, y, color) if steps else frame
+    data = downsample(data, x, y, color)
+    return px.line(
+        data, x=x, y=y, color=color,
+        render_mode="webgl" if raw_points > WEBGL_THRESHOLD else "svg",
+        **px_kwargs,
+    )
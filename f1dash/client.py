@@ -0,0 +1,95 @@
+"""
+Pooled HTTP client for the OpenF1 API.
+
+All requests share one urllib3 connection pool (keep-alive, gzip) through a
+single HTTPAdapter; each thread gets its own lightweight requests.Session on
+top of it. Transient failures (429 and 5xx) are retried with exponential
+backoff, honouring Retry-After, and every request is paced by the shared
+rate limiter in f1dash.ratelimit. Anything that still fails raises, so callers
+decide what to show and nothing is memoized by accident.
+"""
+
+import os
+import threading
+import time
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from f1dash import metrics
+from f1dash.ratelimit import scheduler
+
+BASE_URL = os.environ.get("OPENF1_BASE_URL", "https://api.openf1.org/v1")
+TIMEOUT = 15
+POOL_SIZE = 16  # keep >= the widest thread pool that calls get_json()
+
+_retry = Retry(
+    total=4,
+    backoff_factor=0.5,  # 0.5s, 1s, 2s, 4s
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=_retry)
+_local = threading.local()
+
+
+def query_string(params: dict = None) -> str:
+    """Encode params for OpenF1, keeping comparison operators in keys literal.
+
+    A key ending in an operator is joined to its value as-is, so
+    {"session_key>=": 9000, "date>": "2024-03-02"} becomes
+    "session_key>=9000&date>2024-03-02".
+    """
+    parts = []
+    for key, value in (params or {}).items():
+        sep = "" if key[-1] in "<>=" else "="
+        parts.append(f"{key}{sep}{quote(str(value), safe=':')}")
+    return "&".join(parts)
+
+
+def session() -> requests.Session:
+    """Return this thread's Session, bound to the shared connection pool."""
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = requests.Session()
+        s.mount("https://", _adapter)
+        s.mount("http://", _adapter)
+        s.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+        _local.session = s
+    return s
+
+
+def _get(endpoint: str, params: dict, accept: str) -> requests.Response:
+    waited = scheduler.acquire()
+    started, status, nbytes = time.perf_counter(), "error", 0
+    try:
+        r = session().get(f"{BASE_URL}/{endpoint}", params=query_string(params), timeout=TIMEOUT,
+                          headers={"Accept": accept})
+        status, nbytes = str(r.status_code), len(r.content)
+        r.raise_for_status()
+        return r
+    finally:
+        metrics.observe_upstream(endpoint, status, time.perf_counter() - started, nbytes, waited)
+
+
+def get_json(endpoint: str, params: dict = None) -> list:
+    """GET an endpoint and return the decoded JSON, raising on failure.
+
+    Waits for a token from the shared rate limiter first, queued at the
+    caller's request_priority(). Latency, status and size are recorded in
+    f1dash.metrics.
+    """
+    return _get(endpoint, params, "application/json").json()
+
+
+def get_csv(endpoint: str, params: dict = None) -> bytes:
+    """GET an endpoint as CSV and return the body undecoded, raising on failure.
+
+    params should include {"csv": "true"}; it is not added here so that the
+    params, and therefore cache keys, say which format a payload is in.
+    """
+    return _get(endpoint, params, "text/csv").content
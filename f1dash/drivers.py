@@ -0,0 +1,95 @@
+"""
+Season-wide driver and team metadata.
+
+OpenF1 reports drivers per session, so a driver who changes team mid-season
+simply appears under a different team_name from some session_key on. A
+DriverIndex holds every (session_key, driver_number) pair of a season, loaded
+with a single session_key range request, and is the one place where names,
+teams and team colours are resolved:
+
+    index = DriverIndex(drivers)            # drivers?session_key>=…&session_key<=…
+    laps = index.attach(laps, session_key)  # adds full_name, team_name, team_colour
+"""
+
+import pandas as pd
+
+from f1dash.schema import normalize
+
+DEFAULT_COLOUR = "#e10600"
+TEAM_COLORS = {
+    "Red Bull Racing": "#3671C6",
+    "Ferrari": "#E8002D",
+    "Mercedes": "#27F4D2",
+    "McLaren": "#FF8000",
+    "Aston Martin": "#229971",
+    "Alpine": "#FF87BC",
+    "Williams": "#64C4FF",
+    "RB": "#6692FF",
+    "Kick Sauber": "#52E252",
+    "Haas F1 Team": "#B6BABD",
+    "Cadillac": "#C41E3A",
+}
+
+KEYS = ["session_key", "driver_number"]
+ATTACHED = ["full_name", "team_name", "team_colour"]
+
+
+def _hex(colour) -> str:
+    """Normalise an API team colour ("3671C6") to "#3671C6"; None if missing."""
+    if colour is None or pd.isna(colour) or not str(colour).strip():
+        return None
+    colour = str(colour).strip()
+    return colour if colour.startswith("#") else "#" + colour
+
+
+class DriverIndex:
+    """Driver details keyed by (session_key, driver_number) for one season."""
+
+    def __init__(self, drivers: pd.DataFrame):
+        if drivers.empty or not set(KEYS).issubset(drivers.columns):
+            drivers = pd.DataFrame(columns=KEYS + ["meeting_key"] + ATTACHED)
+        drivers = normalize(drivers, "drivers")
+        for col in ["meeting_key"] + ATTACHED:
+            if col not in drivers.columns:
+                drivers[col] = None
+
+        frame = drivers[KEYS + ["meeting_key"] + ATTACHED].astype({c: object for c in ATTACHED})
+        frame = frame.drop_duplicates(KEYS, keep="last")
+        frame["full_name"] = frame["full_name"].fillna("#" + frame["driver_number"].astype(str))
+
+        # One colour per team, resolved once: the latest colour the API gave
+        # for it, else the built-in palette.
+        api = frame.assign(team_colour=frame["team_colour"].map(_hex)).dropna(subset=["team_name", "team_colour"])
+        self.team_colours = {**TEAM_COLORS, **api.groupby("team_name")["team_colour"].last().to_dict()}
+        frame["team_colour"] = frame["team_name"].map(self.team_colours).fillna(DEFAULT_COLOUR)
+
+        self.table = frame.sort_values(KEYS, ignore_index=True)
+        self._by_key = self.table.set_index(KEYS)[ATTACHED]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def colour(self, team: str) -> str:
+        return self.team_colours.get(team, DEFAULT_COLOUR)
+
+    def attach(self, data: pd.DataFrame, session_key: int = None) -> pd.DataFrame:
+        """Return data with full_name, team_name and team_colour looked up by
+        (session_key, driver_number), using the session_key column if data has one."""
+        if data.empty or "driver_number" not in data.columns:
+            return data
+        sessions = data["session_key"] if "session_key" in data.columns else pd.Series(session_key, index=data.index)
+        keys = pd.MultiIndex.from_arrays([sessions.to_numpy(), data["driver_number"].to_numpy()], names=KEYS)
+        found = self._by_key.reindex(keys)
+        data = data.drop(columns=[c for c in ATTACHED if c in data.columns])
+        return data.assign(**{c: pd.Categorical(found[c].to_numpy()) for c in ATTACHED})
+
+    def drivers(self, session_key: int = None, meeting_key: int = None) -> pd.DataFrame:
+        """One row per driver in a session, or in any session of a meeting
+        (with the team they drove for last)."""
+        if session_key is not None:
+            rows = self.table[self.table["session_key"] == session_key]
+        elif meeting_key is not None:
+            rows = self.table[self.table["meeting_key"] == meeting_key]
+        else:
+            rows = self.table
+        return rows.drop_duplicates("driver_number", keep="last").sort_values("driver_number", ignore_index=True)
@@ -0,0 +1,93 @@
+"""
+Cache for built figures, shared by reruns and users.
+
+Built figures are kept keyed by the chart, the selection and a fingerprint of
+the data they were built from, so a rerun with unchanged inputs reuses the
+figure instead of running Plotly Express and the theme again. A figure's
+size is its serialized JSON, measured once when it is built: that is the
+payload the browser receives, which f1dash.charts keeps down by capping
+traces at MAX_POINTS. Plotly itself is not imported here: only the views that
+draw charts need it.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import pandas as pd
+
+from f1dash import metrics
+
+FIGURE_CACHE_ENTRIES = int(os.environ.get("OPENF1_FIGURE_CACHE_ENTRIES", 128))
+FIGURE_CACHE_MB = float(os.environ.get("OPENF1_FIGURE_CACHE_MB", 64))
+
+
+def fingerprint(frame: pd.DataFrame) -> str:
+    """Content hash of a frame: same rows, columns and values in the same order."""
+    h = hashlib.blake2b(repr((frame.shape, list(frame.columns))).encode(), digest_size=16)
+    for col in frame.columns:
+        values = frame[col]
+        try:
+            hashed = pd.util.hash_pandas_object(values, index=False)
+        except TypeError:  # unhashable cells, e.g. lists in laps.segments_sector_1
+            hashed = pd.util.hash_pandas_object(values.astype(str), index=False)
+        h.update(hashed.to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def figure_bytes(fig) -> int:
+    """Serialized size of a figure, i.e. what is sent to the browser."""
+    return len(fig.to_json())
+
+
+class FigureCache:
+    """Thread-safe LRU of built figures, bounded by entries and payload bytes.
+
+    Cached figures are shared between reruns and users, so they must be final
+    when built: apply layout and theme inside the build function.
+    """
+
+    def __init__(self, max_entries: int = FIGURE_CACHE_ENTRIES, max_bytes: int = int(FIGURE_CACHE_MB * 2**20)):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._figures: OrderedDict = OrderedDict()  # key -> (figure, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get_or_build(self, key: tuple, build: Callable) -> tuple:
+        """(figure, payload bytes) for key: cached, or from build() and then cached."""
+        chart = key[0]
+        with self._lock:
+            entry = self._figures.get(key)
+            if entry is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                metrics.FIGURE_CACHE.inc(chart=chart, result="hit")
+                return entry
+            self.misses += 1
+        metrics.FIGURE_CACHE.inc(chart=chart, result="miss")
+
+        fig = build()
+        size = figure_bytes(fig)
+        with self._lock:
+            if key not in self._figures and size <= self.max_bytes:
+                self._figures[key] = (fig, size)
+                self._bytes += size
+                while len(self._figures) > self.max_entries or self._bytes > self.max_bytes:
+                    _, (_, evicted) = self._figures.popitem(last=False)
+                    self._bytes -= evicted
+                    self.evictions += 1
+        return fig, size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._figures),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,94 @@
+"""
+Columnar ingestion for the large session endpoints.
+
+laps and position are most of what a session weighs. As JSON they are decoded
+into a list of dicts and then copied again into a DataFrame, so loading one
+briefly holds two full copies of it, mostly as Python objects. For these
+endpoints the dashboard asks OpenF1 for CSV instead (``csv=true``) and parses
+the bytes with pyarrow straight into the schema's column types.
+
+Endpoints in CHUNKED are requested in windows of their date column across the
+session, CHUNK_MINUTES wide, so no single response is huge; each window is a
+separate, separately cached request:
+
+    payloads = [cache.get_or_fetch("position", p, get_csv)
+                for p in csv_requests("position", 9161, start, end)]
+    frame = read_csv(payloads, "position")
+
+pyarrow.csv is imported on the first parse, so code that only plans requests
+(the dashboard's core, the warm-up) does not load the CSV reader.
+"""
+
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+from f1dash.schema import BOOL, CAT, DATE, SCHEMAS, normalize
+
+CSV_ENDPOINTS = {"laps", "position"}
+# Endpoint -> column its windows are cut on. Not laps: a lap's date_start can
+# be missing, and such rows would fall outside every window.
+CHUNKED = {"position": "date"}
+CHUNK_MINUTES = int(os.environ.get("OPENF1_CSV_CHUNK_MINUTES", 60))
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def csv_requests(endpoint: str, session_key: int, start=None, end=None) -> list:
+    """The params of every CSV request that together cover one session.
+
+    Without a start and end (or for an endpoint that is not chunked) this is a
+    single request. The first and last windows are open-ended, so rows dated
+    outside the session's nominal times are not lost.
+    """
+    params = {"session_key": session_key, "csv": "true"}
+    column = CHUNKED.get(endpoint)
+    start = pd.to_datetime(start, errors="coerce", utc=True)
+    end = pd.to_datetime(end, errors="coerce", utc=True)
+    if column is None or pd.isna(start) or pd.isna(end):
+        return [params]
+
+    edges = [t.strftime(DATE_FORMAT) for t in pd.date_range(start, end, freq=f"{CHUNK_MINUTES}min")[1:]]
+    windows = []
+    for lower, upper in zip([None] + edges, edges + [None]):
+        window = dict(params)
+        if lower is not None:
+            window[f"{column}>="] = lower
+        if upper is not None:
+            window[f"{column}<"] = upper
+        windows.append(window)
+    return windows
+
+
+def _arrow_type(dtype: str) -> pa.DataType:
+    if dtype == DATE:
+        return pa.timestamp("us", tz="UTC")
+    if dtype == CAT:
+        return pa.dictionary(pa.int32(), pa.string())
+    if dtype == BOOL:
+        return pa.bool_()
+    return pa.from_numpy_dtype(dtype)
+
+
+def read_table(data: bytes, endpoint: str) -> pa.Table:
+    """Parse one CSV payload into Arrow, typed per the endpoint's schema; None if empty."""
+    import pyarrow.csv as pa_csv
+
+    if not data.strip():
+        return None
+    types = {name: _arrow_type(dtype) for name, dtype in SCHEMAS.get(endpoint, {}).items()}
+    return pa_csv.read_csv(
+        io.BytesIO(data),
+        convert_options=pa_csv.ConvertOptions(column_types=types, strings_can_be_null=True),
+    )
+
+
+def read_csv(payloads: list, endpoint: str) -> pd.DataFrame:
+    """One DataFrame from the CSV payloads of an endpoint, with schema dtypes."""
+    tables = [t for t in (read_table(data, endpoint) for data in payloads) if t is not None]
+    if not tables:
+        return pd.DataFrame()
+    # Windows can disagree on a column's type, e.g. all-null in one of them.
+    table = pa.concat_tables(tables, promote_options="permissive")
+    return normalize(table.to_pandas(), endpoint)
@@ -0,0 +1,199 @@
+"""
+Lap-level derived data.
+
+    laps = attach_stints(laps, stints)  # adds stint_number, compound, tyre_age
+    analytics = analyze_laps(laps, stints)
+
+analyze_laps() scores every driver's race pace from representative laps only:
+lap 1, pit in- and out-laps and outliers (safety car, traffic, incidents) are
+left out, and each lap is corrected for the fuel the car still carried. Per
+driver and stint it then fits lap time against tyre age; the slope is the
+tyre degradation and the scatter around that line the consistency. All of
+it is grouped column arithmetic over the whole session at once, a few
+milliseconds for a 70-lap, 20-driver race.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+STINT_COLUMNS = ["stint_number", "compound", "tyre_age"]
+FUEL_EFFECT = 0.03     # seconds a lap's worth of fuel costs per lap
+OUTLIER_FACTOR = 1.07  # laps slower than this times the driver's median lap are outliers
+MIN_FIT_LAPS = 4       # clean laps a stint needs for a degradation slope
+
+
+class LapAnalytics(NamedTuple):
+    laps: pd.DataFrame     # input laps plus stint columns, clean and fuel_corrected
+    stints: pd.DataFrame   # per driver and stint: compound, laps, pace, degradation, consistency
+    drivers: pd.DataFrame  # per driver: laps, pace, degradation, consistency — fastest first
+
+
+def attach_stints(laps: pd.DataFrame, stints: pd.DataFrame) -> pd.DataFrame:
+    """Return laps with the stint each lap was driven on.
+
+    tyre_age is the set's age in laps when the lap started, counting any laps
+    it had before the stint. Laps before a driver's first recorded stint get NaN.
+    """
+    needed = {"driver_number", "lap_start", "stint_number"}
+    if laps.empty or stints.empty or "lap_number" not in laps.columns or not needed.issubset(stints.columns):
+        return laps
+
+    stints = stints.dropna(subset=["lap_start"]).assign(
+        compound=stints["compound"] if "compound" in stints.columns else None,
+        tyre_age_at_start=stints["tyre_age_at_start"] if "tyre_age_at_start" in stints.columns else 0,
+        _lap=stints["lap_start"].astype("float64"),
+    )
+    merged = pd.merge_asof(
+        laps.drop(columns=[c for c in STINT_COLUMNS if c in laps.columns])
+        .assign(_lap=laps["lap_number"].astype("float64"))
+        .sort_values("_lap", kind="stable"),
+        stints[["driver_number", "_lap", "lap_start", "stint_number", "compound", "tyre_age_at_start"]]
+        .sort_values("_lap", kind="stable"),
+        on="_lap", by="driver_number", direction="backward",
+    )
+    merged["tyre_age"] = (merged["tyre_age_at_start"].fillna(0) + merged["_lap"] - merged["lap_start"]).astype("float32")
+    merged = merged.drop(columns=["_lap", "lap_start", "tyre_age_at_start"])
+    return merged.sort_values(["driver_number", "lap_number"], kind="stable", ignore_index=True)
+
+
+def _segments(*keys: np.ndarray) -> np.ndarray:
+    """Group codes 0, 1, … of runs of equal keys in sorted arrays."""
+    change = np.zeros(len(keys[0]), dtype=bool)
+    for key in keys:
+        change[1:] |= key[1:] != key[:-1]
+    return np.cumsum(change)
+
+
+def _group_median(values: np.ndarray, codes: np.ndarray, n: int) -> np.ndarray:
+    """Median of values per group code, ignoring NaN; NaN for groups without values."""
+    counts = np.bincount(codes, weights=~np.isnan(values), minlength=n).astype(int)
+    if not len(values):
+        return np.full(n, np.nan)
+    starts = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=n))[:-1]])
+    ordered = values[np.lexsort((values, codes))]  # by group, NaN last within each
+    lo = np.minimum(starts + np.maximum(counts - 1, 0) // 2, len(values) - 1)
+    hi = np.minimum(starts + counts // 2, len(values) - 1)
+    return np.where(counts > 0, (ordered[lo] + ordered[hi]) / 2, np.nan)
+
+
+def clean_laps(laps: pd.DataFrame) -> np.ndarray:
+    """Boolean mask of the laps that represent a driver's pace.
+
+    laps must be sorted by driver_number and lap_number, as attach_stints()
+    returns them. Dropped are lap 1, laps without a time, pit out-laps, in-laps
+    (the lap before an out-lap or before a new stint) and laps slower than
+    OUTLIER_FACTOR times the driver's median of the remaining laps.
+    """
+    driver = laps["driver_number"].to_numpy()
+    duration = laps["lap_duration"].to_numpy("float64", na_value=np.nan)
+    out_lap = laps["is_pit_out_lap"].fillna(False).to_numpy(bool) if "is_pit_out_lap" in laps.columns \
+        else np.zeros(len(laps), dtype=bool)
+    next_same_driver = np.append(driver[1:] == driver[:-1], False)
+    in_lap = np.append(out_lap[1:], False)
+    if "stint_number" in laps.columns:
+        stint = laps["stint_number"].to_numpy("float64", na_value=np.nan)
+        in_lap |= np.append(stint[1:] > stint[:-1], False)
+    in_lap &= next_same_driver
+
+    clean = ~np.isnan(duration) & (laps["lap_number"].to_numpy() > 1) & ~out_lap & ~in_lap
+    codes = _segments(driver)
+    median = _group_median(np.where(clean, duration, np.nan), codes, codes[-1] + 1 if len(codes) else 0)
+    return clean & (duration <= median[codes] * OUTLIER_FACTOR)
+
+
+def analyze_laps(laps: pd.DataFrame, stints: pd.DataFrame = None, total_laps: int = None) -> LapAnalytics:
+    """Degradation, fuel-corrected pace and consistency of every driver in a session.
+
+    laps may already carry the stint columns (e.g. a precomputed lap frame);
+    otherwise they are attached from stints. fuel_corrected is lap_duration
+    minus FUEL_EFFECT per lap still to go, total_laps being the session's
+    lap count (by default the highest lap_number). Per stint, degradation is
+    the least-squares slope of fuel_corrected over tyre_age in seconds per lap
+    (NaN with fewer than MIN_FIT_LAPS clean laps), and consistency the
+    standard deviation of the laps around that line. Driver rows pool their
+    stints: median pace, a lap-weighted degradation and pooled consistency.
+    """
+    if laps.empty or not {"driver_number", "lap_number", "lap_duration"}.issubset(laps.columns):
+        return LapAnalytics(laps, pd.DataFrame(), pd.DataFrame())
+    if "stint_number" not in laps.columns and stints is not None:
+        laps = attach_stints(laps, stints)
+    laps = laps.sort_values(["driver_number", "lap_number"], kind="stable", ignore_index=True)
+    if "stint_number" not in laps.columns:  # no stints: the whole session is one stint
+        laps = laps.assign(stint_number=1, compound=None, tyre_age=laps["lap_number"].astype("float32"))
+
+    total_laps = total_laps or int(laps["lap_number"].max())
+    laps = laps.assign(
+        clean=clean_laps(laps),
+        fuel_corrected=laps["lap_duration"] - FUEL_EFFECT * (total_laps - laps["lap_number"]),
+    )
+
+    # Laps are sorted by driver and lap, so every stint is a run of rows and
+    # bincount over the run codes sums it. Centred sums give each stint's
+    # least-squares fit: slope Sxy / Sxx, residual sum of squares Syy - slope * Sxy.
+    rows = laps.loc[laps["stint_number"].notna()]
+    driver = rows["driver_number"].to_numpy()
+    stint = _segments(driver, rows["stint_number"].to_numpy("float64"))
+    first = np.flatnonzero(np.diff(stint, prepend=-1))  # first row of every stint
+    n = len(first)
+    x = rows["tyre_age"].to_numpy("float64", na_value=np.nan)
+    y = rows["fuel_corrected"].to_numpy("float64", na_value=np.nan)
+    fit = rows["clean"].to_numpy() & ~np.isnan(x)
+    x, y = np.where(fit, x, 0.0), np.where(fit, y, 0.0)
+    duration = np.where(fit, rows["lap_duration"].to_numpy("float64", na_value=np.nan), np.nan)
+    lap_number = rows["lap_number"].to_numpy()
+
+    def total(values):
+        return np.bincount(stint, weights=values, minlength=n)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        count = total(fit)
+        dx = np.where(fit, x - (total(x) / count)[stint], 0.0)
+        dy = np.where(fit, y - (total(y) / count)[stint], 0.0)
+        sxx, sxy, syy = total(dx * dx), total(dx * dy), total(dy * dy)
+        fitted = (count >= MIN_FIT_LAPS) & (sxx > 0)
+        slope = np.where(fitted, sxy / sxx, np.nan)
+        rss = np.maximum(syy - np.where(fitted, slope * sxy, 0.0), 0.0)
+        dof = np.maximum(count - np.where(fitted, 2, 1), 0)
+        stint_table = pd.DataFrame({
+            "driver_number": driver[first],
+            "stint_number": rows["stint_number"].to_numpy()[first].astype(int),
+            "compound": rows["compound"].to_numpy()[first],
+            "first_lap": np.minimum.reduceat(lap_number, first) if n else lap_number[:0],
+            "last_lap": np.maximum.reduceat(lap_number, first) if n else lap_number[:0],
+            "laps": count.astype(int),
+            "pace": total(y) / count,
+            "best": np.fmin.reduceat(duration, first) if n else duration[:0],
+            "degradation": slope,
+            "consistency": np.sqrt(rss / np.where(dof > 0, dof, np.nan)),
+        })
+
+        # Drivers pool their stints, whose rows are in driver order as well.
+        owner = _segments(driver[first])
+        lead = np.flatnonzero(np.diff(owner, prepend=-1))  # first stint of every driver
+        m = len(lead)
+
+        def pooled(values):
+            return np.bincount(owner, weights=values, minlength=m)
+
+        weight = np.where(fitted, count, 0.0)
+        driver_table = pd.DataFrame({
+            "driver_number": driver[first][lead],
+            "laps": pooled(count).astype(int),
+            "pace": _group_median(np.where(fit, y, np.nan), _segments(driver), m),
+            "best": np.fmin.reduceat(stint_table["best"].to_numpy(), lead) if m else duration[:0],
+            "degradation": pooled(np.nan_to_num(slope) * weight) / pooled(weight),
+            "consistency": np.sqrt(pooled(rss) / np.where(pooled(dof) > 0, pooled(dof), np.nan)),
+        })
+
+    # Carry driver details (full_name, team_name, …) over when laps have them.
+    for col in ("full_name", "name_acronym", "team_name", "team_colour"):
+        if col in rows.columns:
+            values = rows[col].to_numpy()[first]
+            stint_table[col] = values
+            driver_table[col] = values[lead]
+
+    stint_table = stint_table[stint_table["laps"] > 0].reset_index(drop=True)
+    driver_table = driver_table.sort_values("pace", kind="stable", ignore_index=True)
+    return LapAnalytics(laps, stint_table, driver_table)
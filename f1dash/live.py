@@ -0,0 +1,137 @@
+"""
+Incremental polling for sessions that are in progress.
+
+A LiveFeed holds the rows of one (endpoint, session_key) seen so far and,
+on refresh, asks OpenF1 only for rows at or after its cursor, e.g.
+``position?session_key=9161&date>=2024-03-02T15:41:07``. Upstream bytes per
+refresh are therefore proportional to what is new, not to the session size.
+Feeds live in a process-wide FeedRegistry so every viewer of a live session
+shares one poll per interval.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, NamedTuple
+
+import pandas as pd
+
+from f1dash.client import get_json
+from f1dash.schema import normalize
+
+POLL_INTERVAL = 10  # seconds between upstream polls of a live feed
+IDLE_EXPIRY = 3600  # drop feeds nobody has read for this long
+# A session counts as live from shortly before its start until results settle.
+LIVE_BEFORE = timedelta(minutes=15)
+LIVE_AFTER = timedelta(minutes=30)
+# An open row this much older than the newest row is not going to close
+# (e.g. a retired driver's last lap) and no longer holds the cursor back.
+OPEN_WINDOW = timedelta(minutes=5)
+
+
+class FeedSpec(NamedTuple):
+    cursor: str       # timestamp column used for the date>= filter
+    keys: tuple       # columns identifying a row, for de-duplication; the last orders a group's rows
+    open_col: str = None  # a group's latest row, while this is still null, gets re-requested
+    never_closed: tuple = ()  # values of the last key whose open_col stays null for good
+
+
+LIVE_ENDPOINTS = {
+    # OpenF1 never times lap 1.
+    "laps": FeedSpec("date_start", ("driver_number", "lap_number"), open_col="lap_duration", never_closed=(1,)),
+    "position": FeedSpec("date", ("driver_number", "date")),
+    "pit": FeedSpec("date", ("driver_number", "lap_number")),
+    "weather": FeedSpec("date", ("date",)),
+}
+
+
+def session_is_live(date_start, date_end, now: datetime = None) -> bool:
+    """True while a session is running (with a little slack either side)."""
+    start = pd.to_datetime(date_start, errors="coerce", utc=True)
+    end = pd.to_datetime(date_end, errors="coerce", utc=True)
+    if pd.isna(start) or pd.isna(end):
+        return False
+    now = now or datetime.now(timezone.utc)
+    return start - LIVE_BEFORE <= now <= end + LIVE_AFTER
+
+
+class LiveFeed:
+    """Append-only view of one endpoint for one live session."""
+
+    def __init__(self, endpoint: str, session_key: int, fetch_json: Callable = get_json):
+        self.endpoint = endpoint
+        self.session_key = session_key
+        self.spec = LIVE_ENDPOINTS[endpoint]
+        self._fetch_json = fetch_json
+        self._lock = threading.Lock()
+        self.frame = pd.DataFrame()
+        self.polled_at = 0.0
+        self.read_at = time.time()
+        self.last_batch = 0  # rows received by the most recent poll
+
+    def _since(self):
+        """Cursor for the next request: the newest row, or the oldest still-open one.
+
+        Only the latest row of each group (e.g. a driver's current lap) can be
+        open, and only within OPEN_WINDOW of the newest row.
+        """
+        spec, frame = self.spec, self.frame
+        if frame.empty or spec.cursor not in frame.columns:
+            return None
+        latest = frame[spec.cursor].max()
+        if pd.isna(latest):
+            return None
+        *group, order = spec.keys
+        if spec.open_col in frame.columns and order in frame.columns and set(group) <= set(frame.columns):
+            current = frame.sort_values(order, kind="stable").drop_duplicates(group, keep="last")
+            still_open = current.loc[
+                current[spec.open_col].isna()
+                & ~current[order].isin(spec.never_closed)
+                & (current[spec.cursor] >= latest - OPEN_WINDOW),
+                spec.cursor,
+            ]
+            if not still_open.empty:
+                return still_open.min()
+        return latest
+
+    def refresh(self, min_interval: float = POLL_INTERVAL) -> pd.DataFrame:
+        """Poll upstream if the last poll is older than min_interval; return the frame."""
+        with self._lock:
+            self.read_at = time.time()
+            if self.read_at - self.polled_at < min_interval:
+                return self.frame
+            params = {"session_key": self.session_key}
+            since = self._since()
+            if since is not None:
+                params[f"{self.spec.cursor}>="] = since.strftime("%Y-%m-%dT%H:%M:%S.%f")
+            new = normalize(pd.DataFrame(self._fetch_json(self.endpoint, params)), self.endpoint)
+            self.polled_at = time.time()
+            self.last_batch = len(new)
+            if not new.empty:
+                keys = [k for k in self.spec.keys if k in new.columns]
+                merged = new if self.frame.empty else pd.concat([self.frame, new], ignore_index=True)
+                if keys:
+                    merged = merged.drop_duplicates(keys, keep="last")
+                if self.spec.cursor in merged.columns:
+                    merged = merged.sort_values(self.spec.cursor, kind="stable", ignore_index=True)
+                self.frame = merged
+            return self.frame
+
+
+class FeedRegistry:
+    """Process-wide set of live feeds, shared by every user session."""
+
+    def __init__(self, fetch_json: Callable = get_json):
+        self._fetch_json = fetch_json
+        self._feeds: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, session_key: int) -> LiveFeed:
+        now = time.time()
+        with self._lock:
+            for key in [k for k, f in self._feeds.items() if now - f.read_at > IDLE_EXPIRY]:
+                del self._feeds[key]
+            feed = self._feeds.get((endpoint, session_key))
+            if feed is None:
+                feed = self._feeds[(endpoint, session_key)] = LiveFeed(endpoint, session_key, self._fetch_json)
+            return feed
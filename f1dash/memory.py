@@ -0,0 +1,139 @@
+"""
+Size-bounded in-process cache for API data.
+
+Stands in for st.cache_data on the dashboard's fetch helpers. st.cache_data
+has no memory bound, so every distinct request users touched stayed in RAM
+until its TTL ran out; MemoryCache estimates the size of each value and
+evicts least-recently-used entries once the total passes MEMORY_BUDGET_MB.
+Values are shared by all callers rather than copied per hit, so treat them as
+read-only, as the dashboard already does.
+
+    @memory_cache.memoize
+    def load(endpoint, params): ...
+
+Footprint, hits, misses and evictions are exported through f1dash.metrics.
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+import pandas as pd
+
+from f1dash import metrics
+from f1dash.cache import LIVE_TTL
+
+MEMORY_BUDGET_MB = float(os.environ.get("OPENF1_MEMORY_BUDGET_MB", 256))
+SAMPLE_ROWS = 100  # list sizes are extrapolated from this many items
+
+
+def sizeof(value) -> int:
+    """Approximate bytes held by a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (bytes, str)):
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        sample = value[:SAMPLE_ROWS]
+        per_item = sum(sizeof(v) for v in sample) / len(sample) if sample else 0
+        return sys.getsizeof(value) + int(per_item * len(value))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    if hasattr(value, "__dict__"):  # e.g. DriverIndex: the frames it holds
+        return sys.getsizeof(value) + sum(sizeof(v) for v in vars(value).values())
+    return sys.getsizeof(value)
+
+
+def _key_part(value):
+    """JSON fallback for arguments: numpy scalars as their value, else str."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+class MemoryCache:
+    """Thread-safe LRU of computed values with a byte budget and per-entry TTL."""
+
+    def __init__(self, max_bytes: int = int(MEMORY_BUDGET_MB * 2**20), ttl: float = LIVE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get_or_compute(self, key, compute: Callable):
+        """The cached value for key, or compute() stored under it.
+
+        Exceptions propagate and are not cached, so a failed fetch is retried
+        on the next call.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                metrics.MEMORY_CACHE.inc(result="hit")
+                return entry[0]
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+        metrics.MEMORY_CACHE.inc(result="miss")
+
+        value = compute()
+        size = sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size <= self.max_bytes:
+                self._entries[key] = (value, size, time.time() + self.ttl)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+                    metrics.MEMORY_CACHE.inc(result="evicted")
+        return value
+
+    def memoize(self, fn: Callable) -> Callable:
+        """Cache fn's results keyed by its name and arguments."""
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__qualname__, json.dumps([args, kwargs], sort_keys=True, default=_key_part))
+            return self.get_or_compute(key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "budget_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+memory_cache = MemoryCache()
+
+metrics.REGISTRY.gauge(
+    "openf1_memory_cache_bytes", "Estimated bytes held by the in-process API data cache.",
+    lambda: {(): memory_cache.stats()["bytes"]})
+metrics.REGISTRY.gauge(
+    "openf1_memory_cache_entries", "Entries in the in-process API data cache.",
+    lambda: {(): memory_cache.stats()["entries"]})
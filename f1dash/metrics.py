@@ -0,0 +1,261 @@
+"""
+Performance instrumentation: cumulative metrics plus a per-rerun trace.
+
+Two views of the same measurements:
+
+- REGISTRY holds process-wide counters and histograms (upstream latency,
+  status and bytes per endpoint, fetch results by cache tier, time per
+  stage) and renders them in the Prometheus text format, either on demand
+  (exposition()) or from a small HTTP exporter (start_http_server()).
+- A trace is the list of spans recorded during one script rerun, which the
+  dashboard's debug panel shows as a breakdown of where the time went.
+
+Fetches are attributed to the cache tier that answered them. fetching()
+starts with source "memory" (the in-process MemoryCache); layers further
+down call note_source("shared") when the shared ResponseCache is consulted
+and the HTTP client calls observe_upstream() when a request actually goes out.
+"""
+
+import contextlib
+import contextvars
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, NamedTuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values: dict = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(n, "") for n in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(labels.get(n, "") for n in self.labels), 0)
+
+    def exposition(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labels, key)} {value:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self._series: dict = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(n, "") for n in self.labels)
+        with self._lock:
+            series = self._series.setdefault(key, [0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def exposition(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets + ("+Inf",), series[:-2] + [series[-1]]):
+                    le = _labels(self.labels + ("le",), key + (f"{bound:g}" if bound != "+Inf" else bound,))
+                    lines.append(f"{self.name}_bucket{le} {count}")
+                lines.append(f"{self.name}_sum{_labels(self.labels, key)} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{_labels(self.labels, key)} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    """A value read at export time from a callback returning {label values: value}."""
+
+    def __init__(self, name: str, help: str, read: Callable, labels: tuple = ()):
+        self.name, self.help, self.read, self.labels = name, help, read, labels
+
+    def exposition(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for key, value in sorted(self.read().items()):
+            lines.append(f"{self.name}{_labels(self.labels, key)} {value:g}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict = {}
+
+    def _add(self, metric):
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labels: tuple = ()) -> Counter:
+        return self._add(Counter(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def gauge(self, name: str, help: str, read: Callable, labels: tuple = ()) -> Gauge:
+        return self._add(Gauge(name, help, read, labels))
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text format."""
+        return "\n".join(line for m in self._metrics.values() for line in m.exposition()) + "\n"
+
+
+REGISTRY = Registry()
+
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "openf1_upstream_requests_total", "Requests sent to OpenF1, by HTTP status.", ("endpoint", "status"))
+UPSTREAM_SECONDS = REGISTRY.histogram(
+    "openf1_upstream_request_seconds", "OpenF1 request latency, including retries.", ("endpoint",))
+UPSTREAM_BYTES = REGISTRY.counter(
+    "openf1_upstream_response_bytes_total", "Decoded bytes received from OpenF1.", ("endpoint",))
+RATELIMIT_WAIT = REGISTRY.histogram(
+    "openf1_ratelimit_wait_seconds", "Time requests spent queued for the rate limiter.")
+FETCHES = REGISTRY.counter(
+    "openf1_fetch_total", "Dashboard fetches, by the cache tier that answered and outcome.",
+    ("endpoint", "source", "status"))
+FETCH_SECONDS = REGISTRY.histogram(
+    "openf1_fetch_seconds", "Dashboard fetch latency, by the cache tier that answered.", ("endpoint", "source"))
+STAGE_SECONDS = REGISTRY.histogram(
+    "openf1_stage_seconds", "Time spent per rendering stage (prepare, figure, render, tab).", ("stage", "name"))
+MEMORY_CACHE = REGISTRY.counter(
+    "openf1_memory_cache_total", "In-process API data cache lookups and evictions.", ("result",))
+FIGURE_CACHE = REGISTRY.counter(
+    "openf1_figure_cache_total", "Figure cache lookups, by chart and hit or miss.", ("chart", "result"))
+RERUN_SECONDS = REGISTRY.histogram(
+    "openf1_rerun_seconds", "Wall time of a full script rerun.")
+
+
+# ── per-rerun trace ───────────────────────────────────────────────────────────
+class Span(NamedTuple):
+    stage: str      # fetch, prepare, figure, render, tab
+    name: str       # endpoint, tab or chart
+    seconds: float
+    detail: dict
+
+
+_trace = contextvars.ContextVar("openf1_trace", default=None)
+_fetch = contextvars.ContextVar("openf1_fetch", default=None)
+
+
+def start_trace() -> list:
+    """Begin a new trace for this rerun; spans from worker threads that copied
+    this context are collected into it too."""
+    trace = []
+    _trace.set(trace)
+    return trace
+
+
+def current_trace() -> list:
+    return _trace.get() or []
+
+
+def _record(span: Span):
+    trace = _trace.get()
+    if trace is not None:
+        trace.append(span)
+
+
+@contextlib.contextmanager
+def span(stage: str, name: str, **detail):
+    """Time the enclosed block as one stage of the current rerun.
+
+    Yields the detail dict, so the block can add what it measured.
+    """
+    started = time.perf_counter()
+    try:
+        yield detail
+    finally:
+        seconds = time.perf_counter() - started
+        STAGE_SECONDS.observe(seconds, stage=stage, name=name)
+        _record(Span(stage, name, seconds, detail))
+
+
+class FetchRecord:
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.source = "memory"
+        self.status = "ok"
+        self.bytes = 0
+
+
+@contextlib.contextmanager
+def fetching(endpoint: str):
+    """Time one dashboard fetch and attribute it to the tier that served it."""
+    record = FetchRecord(endpoint)
+    token = _fetch.set(record)
+    started = time.perf_counter()
+    try:
+        yield record
+    except Exception:
+        record.status = "error"
+        raise
+    finally:
+        _fetch.reset(token)
+        seconds = time.perf_counter() - started
+        FETCHES.inc(endpoint=endpoint, source=record.source, status=record.status)
+        FETCH_SECONDS.observe(seconds, endpoint=endpoint, source=record.source)
+        _record(Span("fetch", endpoint, seconds,
+                     {"source": record.source, "status": record.status, "bytes": record.bytes}))
+
+
+def note_source(source: str):
+    """Mark the current fetch as answered by a slower tier ("shared")."""
+    record = _fetch.get()
+    if record is not None and record.source == "memory":
+        record.source = source
+
+
+def observe_upstream(endpoint: str, status: str, seconds: float, nbytes: int, waited: float = 0.0):
+    """Record one OpenF1 request; called by the HTTP client."""
+    UPSTREAM_REQUESTS.inc(endpoint=endpoint, status=status)
+    UPSTREAM_SECONDS.observe(seconds, endpoint=endpoint)
+    UPSTREAM_BYTES.inc(nbytes, endpoint=endpoint)
+    RATELIMIT_WAIT.observe(waited)
+    record = _fetch.get()
+    if record is not None:
+        record.source = "upstream"
+        record.bytes += nbytes
+
+
+# ── exporter ──────────────────────────────────────────────────────────────────
+def start_http_server(port: int, registry: Registry = REGISTRY) -> ThreadingHTTPServer:
+    """Serve registry.exposition() at /metrics from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.exposition().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, name="openf1-metrics", daemon=True).start()
+    return server
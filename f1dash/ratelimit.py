@@ -0,0 +1,112 @@
+"""
+Client-side rate limiting with priorities for OpenF1 requests.
+
+Every upstream request takes a token from one process-wide token bucket.
+When the bucket is empty, callers queue by priority: FOREGROUND work (the
+view a user is waiting on) is always served before BACKGROUND work (warm-up,
+prefetching), and callers of equal priority are served first come, first
+served. The priority of the current code path is a context variable:
+
+    with request_priority(BACKGROUND):
+        fetch(...)
+"""
+
+import contextlib
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+
+from f1dash import metrics
+
+FOREGROUND = 0
+BACKGROUND = 10
+
+RATE = float(os.environ.get("OPENF1_RATE_LIMIT", 3))  # requests per second
+BURST = int(os.environ.get("OPENF1_RATE_BURST", 6))
+
+_priority = contextvars.ContextVar("openf1_request_priority", default=FOREGROUND)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def request_priority(level: int):
+    """Run the enclosed requests at the given priority."""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+    """Token bucket with a priority queue in front of it."""
+
+    def __init__(self, rate: float = RATE, burst: int = BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._queue: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._granted = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def acquire(self, priority: int = None) -> float:
+        """Block until this caller may send a request; return the time waited."""
+        priority = current_priority() if priority is None else priority
+        entry = (priority, next(self._seq))
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._queue, entry)
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._queue[0] == entry and self._tokens >= 1:
+                    heapq.heappop(self._queue)
+                    self._tokens -= 1
+                    waited = now - start
+                    self._granted += 1
+                    self._wait_total += waited
+                    self._wait_max = max(self._wait_max, waited)
+                    self._cond.notify_all()
+                    return waited
+                timeout = None if self._queue[0] != entry else (1 - self._tokens) / self.rate
+                self._cond.wait(timeout)
+
+    def stats(self) -> dict:
+        """Queue depth per priority and wait-time totals, for monitoring."""
+        with self._cond:
+            depth: dict = {}
+            for priority, _ in self._queue:
+                depth[priority] = depth.get(priority, 0) + 1
+            return {
+                "queue_depth": len(self._queue),
+                "queue_depth_by_priority": depth,
+                "tokens": round(self._tokens, 2),
+                "granted": self._granted,
+                "wait_seconds_total": round(self._wait_total, 3),
+                "wait_seconds_max": round(self._wait_max, 3),
+            }
+
+
+scheduler = RequestScheduler()
+
+metrics.REGISTRY.gauge(
+    "openf1_ratelimit_queue_depth", "Requests waiting for the rate limiter, by priority.",
+    lambda: {(str(p),): n for p, n in {FOREGROUND: 0, BACKGROUND: 0, **scheduler.stats()["queue_depth_by_priority"]}.items()},
+    ("priority",))
+metrics.REGISTRY.gauge(
+    "openf1_ratelimit_tokens", "Tokens currently available in the rate limiter bucket.",
+    lambda: {(): scheduler.stats()["tokens"]})
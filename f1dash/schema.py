@@ -0,0 +1,87 @@
+"""
+Compact dtypes for OpenF1 responses.
+
+pd.DataFrame(records) gives object columns for every string and int64/float64
+for every number. normalize() converts a frame to the per-endpoint schema
+below at ingest: repeated strings become categoricals, small integers use
+int8/int16, measurements float32 and ISO timestamps datetime64[ns, UTC].
+Columns not listed are left alone.
+"""
+
+import pandas as pd
+
+CAT = "category"
+DATE = "datetime"
+BOOL = "boolean"
+
+_KEYS = {"session_key": "int32", "meeting_key": "int32"}
+_DRIVER = {"driver_number": "int8"}
+
+SCHEMAS = {
+    "drivers": {
+        **_KEYS, **_DRIVER,
+        "full_name": CAT, "broadcast_name": CAT, "name_acronym": CAT, "first_name": CAT,
+        "last_name": CAT, "team_name": CAT, "team_colour": CAT, "country_code": CAT,
+        "headshot_url": CAT,
+    },
+    "laps": {
+        **_KEYS, **_DRIVER,
+        "lap_number": "int16", "lap_duration": "float32", "date_start": DATE,
+        "duration_sector_1": "float32", "duration_sector_2": "float32", "duration_sector_3": "float32",
+        "i1_speed": "int16", "i2_speed": "int16", "st_speed": "int16", "is_pit_out_lap": BOOL,
+    },
+    "stints": {
+        **_KEYS, **_DRIVER,
+        "stint_number": "int8", "lap_start": "int16", "lap_end": "int16",
+        "tyre_age_at_start": "int16", "compound": CAT,
+    },
+    "pit": {
+        **_KEYS, **_DRIVER,
+        "lap_number": "int16", "pit_duration": "float32", "date": DATE,
+    },
+    "position": {
+        **_KEYS, **_DRIVER,
+        "position": "int8", "date": DATE,
+    },
+    "weather": {
+        **_KEYS,
+        "date": DATE, "air_temperature": "float32", "track_temperature": "float32",
+        "humidity": "float32", "pressure": "float32", "rainfall": "int8",
+        "wind_direction": "int16", "wind_speed": "float32",
+    },
+    "session_result": {
+        **_KEYS, **_DRIVER,
+        "position": "int8", "points": "float32", "number_of_laps": "int16",
+        "dnf": BOOL, "dns": BOOL, "dsq": BOOL,
+    },
+}
+
+
+def _convert(col: pd.Series, dtype: str) -> pd.Series:
+    if dtype == DATE:
+        return pd.to_datetime(col, errors="coerce", utc=True, format="ISO8601")
+    if dtype == CAT:
+        return col.astype(CAT)
+    if dtype == BOOL:
+        return col.astype(BOOL)
+    values = pd.to_numeric(col, errors="coerce")
+    if dtype.startswith("int") and values.isna().any():
+        # Keep gaps as NaN rather than switching to nullable ints, which
+        # Plotly and parts of NumPy do not handle.
+        return values.astype("float32")
+    return values.astype(dtype)
+
+
+def normalize(frame: pd.DataFrame, endpoint: str) -> pd.DataFrame:
+    """Return frame with the endpoint's compact dtypes applied."""
+    schema = SCHEMAS.get(endpoint)
+    if not schema or frame.empty:
+        return frame
+    frame = frame.copy()
+    for name, dtype in schema.items():
+        if name in frame.columns:
+            try:
+                frame[name] = _convert(frame[name], dtype)
+            except (TypeError, ValueError):
+                pass  # unexpected upstream shape: keep the column as delivered
+    return frame
@@ -0,0 +1,150 @@
+"""
+Vectorized championship points engine.
+
+Works on plain DataFrames built from OpenF1 responses, so it can be used and
+tested without Streamlit:
+
+    results = season_race_results(session_result, drivers, race_sessions, meetings)
+    standings = compute_standings(results)
+
+and, once more races have results, without starting over:
+
+    standings = fold_standings(standings, season_race_results(new_results, ...))
+"""
+
+from typing import NamedTuple
+
+import pandas as pd
+
+POINTS_MAP = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
+
+RESULT_COLUMNS = ["session_key", "date", "race", "driver_number", "driver", "team", "position", "points"]
+
+
+class Standings(NamedTuple):
+    drivers: pd.DataFrame       # driver, team, points — best first
+    constructors: pd.DataFrame  # team, points — best first
+    progression: pd.DataFrame   # session_key, race, driver, date, team, points, cumulative_points — chronological
+    races: list                 # race names in calendar order
+
+
+def season_race_results(
+    session_result: pd.DataFrame,
+    drivers: pd.DataFrame,
+    race_sessions: pd.DataFrame,
+    meetings: pd.DataFrame = None,
+) -> pd.DataFrame:
+    """Join season-level responses into one frame with a row per driver per race.
+
+    session_result and drivers may cover more sessions than race_sessions (e.g.
+    a session_key range query); rows outside race_sessions are dropped.
+    """
+    if (
+        session_result.empty
+        or race_sessions.empty
+        or not {"session_key", "position"}.issubset(session_result.columns)
+    ):
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    sessions = race_sessions[["session_key"]].copy()
+    sessions["meeting_key"] = race_sessions.get("meeting_key")
+    sessions["date"] = pd.to_datetime(race_sessions.get("date_start"), errors="coerce", utc=True)
+
+    res = session_result.merge(sessions, on="session_key", how="inner", suffixes=("_result", ""))
+
+    if not drivers.empty and {"session_key", "driver_number"}.issubset(drivers.columns):
+        drv_cols = [c for c in ["session_key", "driver_number", "full_name", "team_name"] if c in drivers.columns]
+        res = res.merge(
+            drivers[drv_cols].drop_duplicates(["session_key", "driver_number"]),
+            on=["session_key", "driver_number"], how="left",
+        )
+
+    for col in ("driver_number", "full_name", "team_name", "points"):
+        if col not in res.columns:
+            res[col] = None
+
+    names = pd.Series(dtype=object)
+    if meetings is not None and not meetings.empty and "meeting_name" in meetings.columns:
+        names = meetings.drop_duplicates("meeting_key").set_index("meeting_key")["meeting_name"]
+    res["race"] = res["meeting_key"].map(names).fillna(res["session_key"].astype(str))
+    res["driver"] = res["full_name"].fillna("#" + res["driver_number"].astype(str))
+    res["team"] = res["team_name"].fillna("Unknown")
+
+    # Use API points if available, otherwise derive them from the finishing position
+    res["position"] = pd.to_numeric(res["position"], errors="coerce")
+    res["points"] = (
+        pd.to_numeric(res["points"], errors="coerce")
+        .fillna(res["position"].map(POINTS_MAP))
+        .fillna(0.0)
+    )
+
+    return res.sort_values(["date", "session_key"], kind="stable")[RESULT_COLUMNS].reset_index(drop=True)
+
+
+def compute_standings(results: pd.DataFrame) -> Standings:
+    """Driver and constructor totals plus cumulative progression in one pass.
+
+    `results` is the output of season_race_results(): one row per driver per
+    race, already in calendar order.
+    """
+    if results.empty:
+        return standings_from_progression(pd.DataFrame(columns=["race", "driver", "team", "points"]), [])
+    return standings_from_progression(_race_points(results), results["race"].drop_duplicates().tolist())
+
+
+def fold_standings(standings: Standings, results: pd.DataFrame) -> Standings:
+    """Standings with further races folded in, equal to recomputing the season.
+
+    `results` holds season_race_results() rows of races new to standings, or
+    replacing races already in it (e.g. the latest race, revised after a
+    penalty); races are matched by name. New races may fall anywhere in the
+    calendar, e.g. one whose results arrived late.
+    """
+    if results.empty:
+        return standings
+    races = results["race"].drop_duplicates().tolist()
+    kept = standings.progression[~standings.progression["race"].isin(races)]
+    progression = pd.concat(
+        [kept.drop(columns="cumulative_points"), _race_points(results)], ignore_index=True
+    )
+    return standings_from_progression(progression, [r for r in standings.races if r not in races] + races)
+
+
+def _race_points(results: pd.DataFrame) -> pd.DataFrame:
+    """One row per (race, driver): when the race was, the team driven for and points scored."""
+    return (
+        results.groupby(["session_key", "race", "driver"], sort=False)
+        .agg(date=("date", "first"), team=("team", "last"), points=("points", "sum"))
+        .reset_index()
+    )
+
+
+def standings_from_progression(progression: pd.DataFrame, races: list) -> Standings:
+    """Totals and cumulative points from per-race rows (race, driver, team, points).
+
+    Rows with the date and session_key of their race are put in calendar
+    order first, and races follows that order; otherwise rows and races are
+    taken to be in calendar order already.
+    """
+    order = [c for c in ("date", "session_key") if c in progression.columns]
+    if order and not progression.empty:
+        progression = progression.sort_values(order, kind="stable", na_position="last", ignore_index=True)
+        races = progression["race"].drop_duplicates().tolist()
+    # Totals are sums over the per-race rows, which keep the order drivers and
+    # teams first appeared in, so ties rank the same however they were built.
+    progression = progression.astype({"race": object, "driver": object, "team": object, "points": "float64"})
+    progression["cumulative_points"] = progression.groupby("driver", sort=False)["points"].cumsum()
+
+    by_driver = progression.groupby("driver", sort=False)
+    drivers = (
+        pd.DataFrame({"team": by_driver["team"].last(), "points": by_driver["points"].sum()})
+        .reset_index()
+        .sort_values("points", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
+    constructors = (
+        progression.groupby("team", sort=False)["points"].sum()
+        .sort_values(ascending=False, kind="stable")
+        .reset_index()
+    )
+    return Standings(drivers, constructors, progression, races)
@@ -0,0 +1,138 @@
+"""
+Background cache warm-up and speculative prefetching.
+
+A Warmer fills the shared ResponseCache ahead of users, always at BACKGROUND
+priority so it never delays a request someone is waiting on:
+
+- warm_defaults() loads what the first visitor sees with default selections:
+  the current season's meetings, the latest meeting's sessions, every
+  endpoint of its Race session, the season's driver index, and it brings the
+  season's championship state (f1dash.artifacts) up to date.
+  start() runs it at startup and then every WARMUP_INTERVAL seconds.
+- prefetch_meetings() loads the sessions of meetings next to the one being
+  browsed, plus the results of their default session, so
+  stepping through the Grand Prix list hits a warm cache.
+
+Requests mirror the dashboard's own (same endpoints and params, CSV windows
+for the endpoints in f1dash.ingest), otherwise they would land under
+different cache keys.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable
+
+import pandas as pd
+
+from f1dash.cache import LIVE_TTL, ResponseCache
+from f1dash.client import get_csv, get_json
+from f1dash.drivers import DriverIndex
+from f1dash.ingest import CSV_ENDPOINTS, csv_requests
+from f1dash.ratelimit import BACKGROUND, request_priority
+
+log = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.environ.get("OPENF1_WARMUP", "1") != "0"
+WARMUP_INTERVAL = int(os.environ.get("OPENF1_WARMUP_INTERVAL", 600))
+SESSION_ENDPOINTS = ("session_result", "laps", "stints", "pit", "position", "weather")
+
+
+def default_session(sessions: list) -> dict:
+    """The session the sidebar selects by default: the Race, else the latest."""
+    for s in sessions:
+        if "race" in str(s.get("session_name", "")).lower():
+            return s
+    return sessions[-1] if sessions else None
+
+
+class Warmer:
+    def __init__(self, cache: ResponseCache, loader: Callable = get_json, artifacts=None):
+        self.cache = cache
+        self.loader = loader
+        self.artifacts = artifacts  # ArtifactStore of the championship state, default one if None
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="openf1-prefetch")
+        self._prefetched: dict = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def load(self, endpoint: str, params: dict, loader: Callable = None) -> list:
+        with request_priority(BACKGROUND):
+            try:
+                return self.cache.get_or_fetch(endpoint, params, loader or self.loader)
+            except Exception as e:  # warming is best-effort
+                log.warning("warm-up of %s %s failed: %s", endpoint, params, e)
+                return []
+
+    def warm_defaults(self, year: int = None):
+        year = year or datetime.now(timezone.utc).year
+        meetings = self.load("meetings", {"year": year})
+        if meetings:
+            sessions = self.load("sessions", {"meeting_key": meetings[-1]["meeting_key"]})
+            session = default_session(sessions)
+            if session:
+                for endpoint in SESSION_ENDPOINTS:
+                    if endpoint in CSV_ENDPOINTS:
+                        for params in csv_requests(endpoint, session["session_key"],
+                                                   session.get("date_start"), session.get("date_end")):
+                            self.load(endpoint, params, get_csv)
+                    else:
+                        self.load(endpoint, {"session_key": session["session_key"]})
+
+        season = self.load("sessions", {"year": year})
+        keys = [s["session_key"] for s in season if "session_key" in s]
+        if keys:
+            drivers = self.load("drivers", {"session_key>=": min(keys), "session_key<=": max(keys)})
+            self.warm_standings(year, season, drivers, meetings)
+
+    def warm_standings(self, year: int, season: list, drivers: list, meetings: list):
+        """Fold finished races into the season's championship state, as the
+        Championship view would: the same session_result request, fetched
+        only for the races the state does not cover yet."""
+        from f1dash.artifacts import ArtifactStore, update_standings  # pyarrow.parquet
+
+        if self.artifacts is None:
+            self.artifacts = ArtifactStore()
+        sessions = pd.DataFrame(season)
+        races = sessions[sessions["session_name"] == "Race"] if "session_name" in sessions.columns else sessions.iloc[0:0]
+        update_standings(
+            self.artifacts, year, races,
+            lambda params: pd.DataFrame(self.load("session_result", params)),
+            DriverIndex(pd.DataFrame(drivers)).table, pd.DataFrame(meetings),
+        )
+
+    def start(self, interval: int = WARMUP_INTERVAL):
+        """Warm the defaults now and then every interval seconds, in a daemon thread."""
+        if self._thread is not None:
+            return
+
+        def loop():
+            while True:
+                started = time.time()
+                try:
+                    self.warm_defaults()
+                    log.info("cache warm-up took %.1fs", time.time() - started)
+                except Exception:  # e.g. an unexpected response; try again next pass
+                    log.exception("cache warm-up failed")
+                time.sleep(interval)
+
+        self._thread = threading.Thread(target=loop, name="openf1-warmup", daemon=True)
+        self._thread.start()
+
+    def prefetch_meetings(self, meeting_keys: list):
+        """Queue low-priority loads for the given meetings (at most once per LIVE_TTL)."""
+        now = time.time()
+        with self._lock:
+            due = [mk for mk in meeting_keys if now - self._prefetched.get(mk, 0) > LIVE_TTL]
+            for mk in due:
+                self._prefetched[mk] = now
+        for mk in due:
+            self._pool.submit(self._prefetch_meeting, mk)
+
+    def _prefetch_meeting(self, meeting_key):
+        session = default_session(self.load("sessions", {"meeting_key": meeting_key}))
+        if session:
+            self.load("session_result", {"session_key": session["session_key"]})
@@ -0,0 +1,53 @@
+"""Regression tests for the championship points engine (f1dash.standings)."""
+
+import pandas as pd
+
+from f1dash.standings import compute_standings, fold_standings, season_race_results
+
+DRIVERS = [(1, "Max VERSTAPPEN", "Red Bull Racing"), (4, "Lando NORRIS", "McLaren"),
+           (16, "Charles LECLERC", "Ferrari")]
+
+
+def _season(n_races: int = 5) -> pd.DataFrame:
+    """season_race_results() rows of n_races, with a different winner per race."""
+    race_sessions = pd.DataFrame({
+        "session_key": [9000 + 5 * i for i in range(n_races)],
+        "meeting_key": [1200 + i for i in range(n_races)],
+        "date_start": [f"2025-03-{1 + 7 * i:02d}T15:00:00+00:00" for i in range(n_races)],
+    })
+    meetings = pd.DataFrame({"meeting_key": race_sessions["meeting_key"],
+                             "meeting_name": [f"Grand Prix {i + 1}" for i in range(n_races)]})
+    session_result, drivers = [], []
+    for i, session_key in enumerate(race_sessions["session_key"]):
+        order = DRIVERS[i % 3:] + DRIVERS[:i % 3]
+        for position, (number, name, team) in enumerate(order, 1):
+            session_result.append({"session_key": session_key, "driver_number": number, "position": position})
+            drivers.append({"session_key": session_key, "driver_number": number, "full_name": name,
+                            "team_name": team})
+    return season_race_results(pd.DataFrame(session_result), pd.DataFrame(drivers), race_sessions, meetings)
+
+
+def _comparable(progression: pd.DataFrame) -> pd.DataFrame:
+    return progression[["race", "driver", "team", "points", "cumulative_points"]].reset_index(drop=True)
+
+
+def test_fold_in_calendar_order_equals_recompute():
+    results = _season()
+    first = results["session_key"] < 9015
+    folded = fold_standings(compute_standings(results[first]), results[~first])
+    expected = compute_standings(results)
+    assert folded.races == expected.races
+    pd.testing.assert_frame_equal(_comparable(folded.progression), _comparable(expected.progression))
+
+
+def test_fold_of_an_earlier_race_equals_recompute():
+    # A race earlier in the calendar folded in after later ones, e.g. one
+    # whose results arrived late.
+    results = _season()
+    late = results["session_key"] == 9005
+    folded = fold_standings(compute_standings(results[~late]), results[late])
+    expected = compute_standings(results)
+    assert folded.races == expected.races == [f"Grand Prix {i}" for i in range(1, 6)]
+    pd.testing.assert_frame_equal(_comparable(folded.progression), _comparable(expected.progression))
+    pd.testing.assert_frame_equal(folded.drivers, expected.drivers)
+    pd.testing.assert_frame_equal(folded.constructors, expected.constructors)